@@ -0,0 +1,40 @@
+"""Identity-keyed memoization for functions of frozen profile objects."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, Concatenate
+
+IDENTITY_MEMO_MAX_SIZE = 32
+
+
+def identity_memo[OwnerT, **P, R](
+    func: Callable[Concatenate[OwnerT, P], R],
+) -> Callable[Concatenate[OwnerT, P], R]:
+    """Memoize ``func`` on the identity of its first argument plus the remaining ones.
+
+    Profiles are large frozen dataclasses looked up on hot paths, where hashing
+    every field costs more than the cached work. Entries are keyed by ``id()``
+    of the first argument and keep that object alive, so an id cannot be reused
+    while its entry exists. The remaining arguments must be hashable. When the
+    memo holds ``IDENTITY_MEMO_MAX_SIZE`` entries it is cleared before the next
+    insert; callers see a handful of distinct profiles per process, so this
+    rarely triggers.
+    """
+    entries: dict[Any, tuple[OwnerT, R]] = {}
+
+    @wraps(func)
+    def wrapper(owner: OwnerT, /, *args: P.args, **kwargs: P.kwargs) -> R:
+        # Single-argument calls, the common case, key on the bare id.
+        key: Any = (id(owner), args, tuple(kwargs.items())) if args or kwargs else id(owner)
+        cached = entries.get(key)
+        if cached is not None and cached[0] is owner:
+            return cached[1]
+        result = func(owner, *args, **kwargs)
+        if len(entries) >= IDENTITY_MEMO_MAX_SIZE:
+            entries.clear()
+        entries[key] = (owner, result)
+        return result
+
+    return wrapper
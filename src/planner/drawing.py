@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, Protocol
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Protocol
 
-from reportlab.pdfgen import canvas
+if TYPE_CHECKING:
+    from reportlab.pdfgen import canvas
 
 
 class DrawingPrimitives(Protocol):
@@ -17,8 +19,12 @@ class DrawingPrimitives(Protocol):
     def string_width(self, text: str, font_name: str, size: float) -> float: ...
     def draw_string(self, x: float, y: float, text: str) -> None: ...
     def draw_centred_string(self, x: float, y: float, text: str) -> None: ...
+    def draw_centred_strings(
+        self, items: Iterable[tuple[float, float, str]], *, font_name: str, size: float
+    ) -> None: ...
     def draw_right_string(self, x: float, y: float, text: str) -> None: ...
     def line(self, x1: float, y1: float, x2: float, y2: float) -> None: ...
+    def lines(self, segments: Iterable[tuple[float, float, float, float]]) -> None: ...
     def rect(
         self, x: float, y: float, width: float, height: float, *, fill: int = 0, stroke: int = 1
     ) -> None: ...
@@ -36,6 +42,14 @@ class DrawingPrimitives(Protocol):
     def circle(
         self, x: float, y: float, radius: float, *, fill: int = 0, stroke: int = 1
     ) -> None: ...
+    def circles(
+        self,
+        centers: Iterable[tuple[float, float]],
+        radius: float,
+        *,
+        fill: int = 0,
+        stroke: int = 1,
+    ) -> None: ...
     def link_rect(self, destination: str, rect: tuple[float, float, float, float]) -> None: ...
     def bookmark_page(self, key: str) -> None: ...
     def add_outline_entry(self, title: str, key: str, *, level: int) -> None: ...
@@ -48,23 +62,49 @@ class DrawingPrimitives(Protocol):
     def save(self) -> None: ...
 
 
+_UNSET: Any = object()
+
+
 class ReportLabPrimitives:
-    """ReportLab-backed implementation of DrawingPrimitives."""
+    """ReportLab-backed implementation of DrawingPrimitives.
+
+    Fill color, stroke color, line width, and font are only written to the
+    content stream when they change, so renderers can re-apply a style per group without
+    emitting redundant operators.
+    """
 
     def __init__(self, target: canvas.Canvas) -> None:
         self._target = target
+        self._fill_color: Any = _UNSET
+        self._stroke_color: Any = _UNSET
+        self._line_width: Any = _UNSET
+        self._font: Any = _UNSET
+        self._saved_states: list[tuple[Any, Any, Any, Any]] = []
 
     def set_fill_color(self, color: Any) -> None:
+        if _same_value(color, self._fill_color):
+            return
         self._target.setFillColor(color)
+        self._fill_color = color
 
     def set_stroke_color(self, color: Any) -> None:
+        if _same_value(color, self._stroke_color):
+            return
         self._target.setStrokeColor(color)
+        self._stroke_color = color
 
     def set_line_width(self, width: float) -> None:
+        if _same_value(width, self._line_width):
+            return
         self._target.setLineWidth(width)
+        self._line_width = width
 
     def set_font(self, font_name: str, size: float) -> None:
+        font = (font_name, size)
+        if _same_value(font, self._font):
+            return
         self._target.setFont(font_name, size)
+        self._font = font
 
     def string_width(self, text: str, font_name: str, size: float) -> float:
         return self._target.stringWidth(text, font_name, size)
@@ -75,12 +115,35 @@ class ReportLabPrimitives:
     def draw_centred_string(self, x: float, y: float, text: str) -> None:
         self._target.drawCentredString(x, y, text)
 
+    def draw_centred_strings(
+        self, items: Iterable[tuple[float, float, str]], *, font_name: str, size: float
+    ) -> None:
+        """Draw (x, y, text) strings centred on x in one text object.
+
+        Expects the canvas font to already be ``font_name`` at ``size``.
+        """
+        text_object = None
+        for x, y, text in items:
+            text_x = x - (self._target.stringWidth(text, font_name, size) / 2)
+            if text_object is None:
+                text_object = self._target.beginText(text_x, y)
+            else:
+                text_object.setTextOrigin(text_x, y)
+            text_object.textOut(text)
+        if text_object is not None:
+            self._target.drawText(text_object)
+
     def draw_right_string(self, x: float, y: float, text: str) -> None:
         self._target.drawRightString(x, y, text)
 
     def line(self, x1: float, y1: float, x2: float, y2: float) -> None:
         self._target.line(x1, y1, x2, y2)
 
+    def lines(self, segments: Iterable[tuple[float, float, float, float]]) -> None:
+        segment_list = list(segments)
+        if segment_list:
+            self._target.lines(segment_list)
+
     def rect(
         self, x: float, y: float, width: float, height: float, *, fill: int = 0, stroke: int = 1
     ) -> None:
@@ -102,6 +165,22 @@ class ReportLabPrimitives:
     def circle(self, x: float, y: float, radius: float, *, fill: int = 0, stroke: int = 1) -> None:
         self._target.circle(x, y, radius, fill=fill, stroke=stroke)
 
+    def circles(
+        self,
+        centers: Iterable[tuple[float, float]],
+        radius: float,
+        *,
+        fill: int = 0,
+        stroke: int = 1,
+    ) -> None:
+        from reportlab.pdfgen.canvas import FILL_NON_ZERO
+
+        path = self._target.beginPath()
+        for x, y in centers:
+            path.circle(x, y, radius)
+        # Non-zero winding keeps overlapping dots solid; even-odd would punch holes.
+        self._target.drawPath(path, fill=fill, stroke=stroke, fillMode=FILL_NON_ZERO)
+
     def link_rect(self, destination: str, rect: tuple[float, float, float, float]) -> None:
         self._target.linkRect("", destination, rect, thickness=0)
 
@@ -113,9 +192,18 @@ class ReportLabPrimitives:
 
     def save_state(self) -> None:
         self._target.saveState()
+        self._saved_states.append(
+            (self._fill_color, self._stroke_color, self._line_width, self._font)
+        )
 
     def restore_state(self) -> None:
         self._target.restoreState()
+        (
+            self._fill_color,
+            self._stroke_color,
+            self._line_width,
+            self._font,
+        ) = self._saved_states.pop()
 
     def translate(self, x: float, y: float) -> None:
         self._target.translate(x, y)
@@ -128,15 +216,23 @@ class ReportLabPrimitives:
 
     def show_page(self) -> None:
         self._target.showPage()
+        self._fill_color = self._stroke_color = self._line_width = self._font = _UNSET
 
     def save(self) -> None:
         self._target.save()
 
 
+def _same_value(value: Any, current: Any) -> bool:
+    return value is current or (current is not _UNSET and value == current)
+
+
 def create_reportlab_primitives(
     output_path: str,
     *,
     pagesize: tuple[float, float],
 ) -> ReportLabPrimitives:
     """Create a ReportLab-backed primitives renderer."""
+    # Imported here so listing templates does not load the PDF writer.
+    from reportlab.pdfgen import canvas
+
     return ReportLabPrimitives(canvas.Canvas(output_path, pagesize=pagesize))
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from math import ceil, floor
 
+from .caching import identity_memo
 from .profiles import RenderProfile
+from .template_geometry import RowBounds, stacked_row_bounds
 
 _POINTS_PER_MM = 72.0 / 25.4
+_MONTH_WEEKDAY_LABEL_Y_OFFSET = 20.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Point:
     """2D point in page units."""
 
@@ -17,7 +21,7 @@ class Point:
     y: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rect:
     """Rectangle in page units."""
 
@@ -35,7 +39,7 @@ class Rect:
         return self.y + self.height
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonthGridGeometry:
     """Resolved geometry for the monthly calendar grid."""
 
@@ -45,10 +49,32 @@ class MonthGridGeometry:
     height: float
     col_width: float
     row_height: float
-    weekday_label_y_offset: float = 20.0
-
-
-@dataclass(frozen=True)
+    weekday_label_y_offset: float = _MONTH_WEEKDAY_LABEL_Y_OFFSET
+    # Derived from the fields above, so replace() keeps them consistent.
+    cell_rects: tuple[tuple[Rect, ...], ...] = field(init=False, repr=False, compare=False)
+    weekday_label_centers: tuple[Point, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        col_xs = tuple(self.start_x + (col_idx * self.col_width) for col_idx in range(7))
+        cell_rects = tuple(
+            tuple(
+                Rect(
+                    x=x,
+                    y=self.start_y - ((row_idx + 1) * self.row_height),
+                    width=self.col_width,
+                    height=self.row_height,
+                )
+                for x in col_xs
+            )
+            for row_idx in range(6)
+        )
+        label_y = self.start_y + self.weekday_label_y_offset
+        label_centers = tuple(Point(x=x + (self.col_width / 2), y=label_y) for x in col_xs)
+        object.__setattr__(self, "cell_rects", cell_rects)
+        object.__setattr__(self, "weekday_label_centers", label_centers)
+
+
+@dataclass(frozen=True, slots=True)
 class WeekGridGeometry:
     """Resolved geometry for the weekly page grid."""
 
@@ -66,7 +92,7 @@ class WeekGridGeometry:
     writing_line_step: float = 30.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyViewGeometry:
     """Resolved geometry for the daily page."""
 
@@ -99,15 +125,21 @@ class DailyViewGeometry:
     checklist_items: int
     checklist_item_height: float
     checklist_box_size: float
-
-
-@dataclass(frozen=True)
-class RowBounds:
-    """Vertical row bounds with center point."""
-
-    top: float
-    center: float
-    bottom: float
+    # Derived from the fields above, so replace() keeps them consistent.
+    schedule_rows: tuple[RowBounds, ...] = field(init=False, repr=False, compare=False)
+    priority_rows: tuple[RowBounds, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        schedule_rows = stacked_row_bounds(
+            top=self.top_y, row_height=self.schedule_hour_height, count=self.schedule_hour_count
+        )
+        priority_rows = stacked_row_bounds(
+            top=self.priorities_y + self.priorities_height,
+            row_height=self.checklist_item_height,
+            count=self.checklist_items,
+        )
+        object.__setattr__(self, "schedule_rows", schedule_rows)
+        object.__setattr__(self, "priority_rows", priority_rows)
 
 
 def mm_to_points(value_mm: float) -> float:
@@ -115,8 +147,9 @@ def mm_to_points(value_mm: float) -> float:
     return value_mm * _POINTS_PER_MM
 
 
+@identity_memo
 def compute_month_grid_geometry(profile: RenderProfile) -> MonthGridGeometry:
-    """Compute monthly grid bounds and cell sizes."""
+    """Compute monthly grid bounds and cell sizes (cached per profile)."""
     month_profile = profile.layout.month
     start_x = profile.sidebar_width + month_profile.side_padding
     start_y = profile.page_height - profile.header_height - month_profile.top_padding
@@ -137,10 +170,7 @@ def month_weekday_label_center(geometry: MonthGridGeometry, col_idx: int) -> Poi
     if not 0 <= col_idx <= 6:
         msg = "col_idx must be between 0 and 6."
         raise ValueError(msg)
-    return Point(
-        x=geometry.start_x + (col_idx * geometry.col_width) + (geometry.col_width / 2),
-        y=geometry.start_y + geometry.weekday_label_y_offset,
-    )
+    return geometry.weekday_label_centers[col_idx]
 
 
 def month_cell_rect(geometry: MonthGridGeometry, row_idx: int, col_idx: int) -> Rect:
@@ -151,12 +181,7 @@ def month_cell_rect(geometry: MonthGridGeometry, row_idx: int, col_idx: int) ->
     if not 0 <= col_idx <= 6:
         msg = "col_idx must be between 0 and 6."
         raise ValueError(msg)
-    return Rect(
-        x=geometry.start_x + (col_idx * geometry.col_width),
-        y=geometry.start_y - ((row_idx + 1) * geometry.row_height),
-        width=geometry.col_width,
-        height=geometry.row_height,
-    )
+    return geometry.cell_rects[row_idx][col_idx]
 
 
 def month_week_label_rect(
@@ -210,10 +235,15 @@ def month_writing_line_points(cell: Rect, *, margin: float) -> tuple[Point, Poin
 
 
 def compute_week_grid_geometry(profile: RenderProfile, *, column_count: int) -> WeekGridGeometry:
-    """Compute weekly grid bounds and per-column geometry."""
+    """Compute weekly grid bounds and per-column geometry (cached per profile)."""
     if column_count < 1:
         msg = "column_count must be >= 1."
         raise ValueError(msg)
+    return _build_week_grid_geometry(profile, column_count=column_count)
+
+
+@identity_memo
+def _build_week_grid_geometry(profile: RenderProfile, *, column_count: int) -> WeekGridGeometry:
 
     start_x = profile.sidebar_width + 40
     start_y = profile.page_height - profile.header_height - 80
@@ -254,18 +284,22 @@ def week_day_label_rect(geometry: WeekGridGeometry, *, column: Rect) -> Rect:
 
 
 def week_writing_line_y_positions(geometry: WeekGridGeometry, *, column: Rect) -> tuple[float, ...]:
-    """Return y positions for weekly writing lines."""
-    positions: list[float] = []
-    line_y = geometry.start_y - geometry.writing_line_top_offset
+    """Return y positions for weekly writing lines, down to the bottom margin inclusive."""
+    first_y = geometry.start_y - geometry.writing_line_top_offset
     min_y = column.y + geometry.writing_line_bottom_margin
-    while line_y >= min_y:
-        positions.append(line_y)
-        line_y -= geometry.writing_line_step
-    return tuple(positions)
+    step = geometry.writing_line_step
+    if step <= 0:
+        msg = "writing line step must be positive."
+        raise ValueError(msg)
+    if first_y < min_y:
+        return ()
+    count = floor((first_y - min_y) / step + 1e-9) + 1
+    return tuple(first_y - (index * step) for index in range(count))
 
 
+@identity_memo
 def compute_daily_view_geometry(profile: RenderProfile) -> DailyViewGeometry:
-    """Compute shared daily page geometry for both compact/full layouts."""
+    """Compute shared daily page geometry for both compact/full layouts (cached per profile)."""
     daily_profile = profile.layout.daily
     start_x = profile.sidebar_width + 40
     top_y = profile.page_height - profile.header_height - 90
@@ -294,6 +328,7 @@ def compute_daily_view_geometry(profile: RenderProfile) -> DailyViewGeometry:
     notes_top_y = priorities_y - section_gap
     notes_height = notes_top_y - notes_y
     checklist_items = 6
+    checklist_item_height = priorities_height / checklist_items
 
     return DailyViewGeometry(
         start_x=start_x,
@@ -323,7 +358,7 @@ def compute_daily_view_geometry(profile: RenderProfile) -> DailyViewGeometry:
         notes_top_y=notes_top_y,
         notes_height=notes_height,
         checklist_items=checklist_items,
-        checklist_item_height=priorities_height / checklist_items,
+        checklist_item_height=checklist_item_height,
         checklist_box_size=13,
     )
 
@@ -333,13 +368,7 @@ def daily_schedule_row_bounds(geometry: DailyViewGeometry, hour_idx: int) -> Row
     if not 0 <= hour_idx < geometry.schedule_hour_count:
         msg = f"hour_idx must be between 0 and {geometry.schedule_hour_count - 1}."
         raise ValueError(msg)
-    row_top = geometry.top_y - (hour_idx * geometry.schedule_hour_height)
-    row_bottom = row_top - geometry.schedule_hour_height
-    return RowBounds(
-        top=row_top,
-        center=row_top - (geometry.schedule_hour_height / 2),
-        bottom=row_bottom,
-    )
+    return geometry.schedule_rows[hour_idx]
 
 
 def daily_priorities_row_bounds(geometry: DailyViewGeometry, item_idx: int) -> RowBounds:
@@ -347,27 +376,17 @@ def daily_priorities_row_bounds(geometry: DailyViewGeometry, item_idx: int) -> R
     if not 0 <= item_idx < geometry.checklist_items:
         msg = f"item_idx must be between 0 and {geometry.checklist_items - 1}."
         raise ValueError(msg)
-    row_top = (
-        geometry.priorities_y
-        + geometry.priorities_height
-        - (item_idx * geometry.checklist_item_height)
-    )
-    row_bottom = row_top - geometry.checklist_item_height
-    return RowBounds(
-        top=row_top,
-        center=row_top - (geometry.checklist_item_height / 2),
-        bottom=row_bottom,
-    )
+    return geometry.priority_rows[item_idx]
 
 
 def ascending_step_positions(*, start: float, end: float, step: float) -> tuple[float, ...]:
-    """Return monotonically increasing positions between two bounds."""
+    """Return monotonically increasing positions strictly between two bounds.
+
+    Positions are computed as ``start + index * step`` so rounding error does
+    not accumulate; an end within 1e-9 steps of a tick is treated as excluded.
+    """
     if step <= 0:
         msg = "step must be positive."
         raise ValueError(msg)
-    positions: list[float] = []
-    pos = start + step
-    while pos < end:
-        positions.append(pos)
-        pos += step
-    return tuple(positions)
+    count = ceil((end - start) / step - 1e-9)
+    return tuple(start + (index * step) for index in range(1, count))
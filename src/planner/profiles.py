@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
+from .caching import identity_memo
 from .config import HEADER_HEIGHT, PAGE_HEIGHT, PAGE_WIDTH, SIDEBAR_WIDTH
 
 
@@ -190,11 +192,15 @@ DEFAULT_LAYOUT_BY_DEVICE = {
 DEFAULT_DEVICE = "remarkable"
 
 
+@lru_cache(maxsize=32)
 def resolve_render_profile(
     device: str = DEFAULT_DEVICE,
     layout: str | None = None,
 ) -> RenderProfile:
-    """Resolve built-in device and layout names into a render profile."""
+    """Resolve built-in device and layout names into a render profile.
+
+    Profiles are immutable, so repeated lookups share one instance per name pair.
+    """
     if device not in DEVICE_PROFILES:
         msg = f"unknown device '{device}'. Valid devices: {', '.join(sorted(DEVICE_PROFILES))}."
         raise ValueError(msg)
@@ -218,6 +224,7 @@ def _layout_candidates(layout_name: str, *, strict_layout: bool) -> tuple[str, .
     return LAYOUT_DENSITY_ORDER[start_idx:]
 
 
+@identity_memo
 def evaluate_render_profile_fit(profile: RenderProfile) -> tuple[str, ...]:
     """Return fit issues for the profile; empty result means the profile is usable."""
     issues: list[str] = []
@@ -304,6 +311,7 @@ def evaluate_render_profile_fit(profile: RenderProfile) -> tuple[str, ...]:
     return tuple(issues)
 
 
+@lru_cache(maxsize=32)
 def resolve_fitted_render_profile(
     device: str = DEFAULT_DEVICE,
     layout: str | None = None,
@@ -12,7 +12,7 @@ from planner.profiles import DeviceProfile
 MISSING = object()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rect:
     """Simple rectangle bounds in device units."""
 
@@ -46,7 +46,7 @@ class Rect:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RenderContext:
     """Context shared by all blocks during rendering."""
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from .contracts import TemplateParamSpec, TemplateSpec
@@ -10,22 +12,23 @@ from .contracts import TemplateParamSpec, TemplateSpec
 BOOL_TRUE = {"1", "true", "yes", "on"}
 BOOL_FALSE = {"0", "false", "no", "off"}
 
+ParamResolver = Callable[[tuple[tuple[str, Any], ...]], dict[str, Any]]
+
 
 def parse_param_pairs(pairs: Sequence[str] | None) -> dict[str, str]:
     """Parse repeatable key=value CLI pairs into a dict."""
-    parsed: dict[str, str] = {}
+    entries: list[tuple[str, str]] = []
     for raw_pair in pairs or ():
-        if "=" not in raw_pair:
+        raw_key, separator, raw_value = raw_pair.partition("=")
+        if not separator:
             msg = f"invalid --param '{raw_pair}'. Expected key=value."
             raise ValueError(msg)
-        raw_key, raw_value = raw_pair.split("=", 1)
         key = raw_key.strip()
-        value = raw_value.strip()
         if not key:
             msg = f"invalid --param '{raw_pair}'. Key cannot be empty."
             raise ValueError(msg)
-        parsed[key] = value
-    return parsed
+        entries.append((key, raw_value.strip()))
+    return dict(entries)
 
 
 def _spec_by_key(spec: TemplateSpec) -> dict[str, TemplateParamSpec]:
@@ -39,116 +42,178 @@ def _spec_by_key(spec: TemplateSpec) -> dict[str, TemplateParamSpec]:
     return indexed
 
 
-def _coerce_value(param: TemplateParamSpec, raw_value: Any, *, template_id: str) -> Any:
+def _invalid_value(raw_value: Any, *, key: str, template_id: str, expected: str) -> ValueError:
+    return ValueError(
+        f"invalid value '{raw_value}' for '{key}' in template '{template_id}'. {expected}"
+    )
+
+
+def _coerce_bool(raw_value: Any, *, key: str, template_id: str) -> bool:
+    if isinstance(raw_value, bool):
+        return raw_value
+    normalized = str(raw_value).strip().lower()
+    if normalized in BOOL_TRUE:
+        return True
+    if normalized in BOOL_FALSE:
+        return False
+    raise _invalid_value(
+        raw_value, key=key, template_id=template_id, expected="Expected a boolean (true/false)."
+    )
+
+
+def _coerce_int(raw_value: Any, *, key: str, template_id: str) -> int:
+    if type(raw_value) is int:
+        return raw_value
+    try:
+        return int(raw_value)
+    except (TypeError, ValueError) as exc:
+        raise _invalid_value(
+            raw_value, key=key, template_id=template_id, expected="Expected an integer."
+        ) from exc
+
+
+def _coerce_float(raw_value: Any, *, key: str, template_id: str) -> float:
+    if type(raw_value) is float:
+        return raw_value
+    try:
+        return float(raw_value)
+    except (TypeError, ValueError) as exc:
+        raise _invalid_value(
+            raw_value, key=key, template_id=template_id, expected="Expected a float."
+        ) from exc
+
+
+def _coerce_str(raw_value: Any, *, key: str, template_id: str) -> str:
+    _ = (key, template_id)
+    return str(raw_value)
+
+
+_COERCERS: dict[type, Callable[..., Any]] = {
+    bool: _coerce_bool,
+    int: _coerce_int,
+    float: _coerce_float,
+    str: _coerce_str,
+}
+
+
+def _build_param_coercer(param: TemplateParamSpec, *, template_id: str) -> Callable[[Any], Any]:
+    """Return a coercer with the type branch and active range/choice checks bound."""
     key = param.key
+    coerce = _COERCERS.get(param.value_type)
+    if coerce is None:
+        msg = f"unsupported param type '{param.value_type}' for '{key}' in '{template_id}'."
+        raise ValueError(msg)
+    choices = param.choices
+    min_value = param.min_value
+    max_value = param.max_value
 
-    if param.value_type is bool:
-        if isinstance(raw_value, bool):
-            coerced = raw_value
-        else:
-            normalized = str(raw_value).strip().lower()
-            if normalized in BOOL_TRUE:
-                coerced = True
-            elif normalized in BOOL_FALSE:
-                coerced = False
-            else:
+    def coerce_value(raw_value: Any) -> Any:
+        coerced = coerce(raw_value, key=key, template_id=template_id)
+
+        if choices and coerced not in choices:
+            valid = ", ".join(str(choice) for choice in choices)
+            raise _invalid_value(
+                coerced, key=key, template_id=template_id, expected=f"Valid values: {valid}."
+            )
+        if isinstance(coerced, (int, float)):
+            if min_value is not None and coerced < min_value:
+                raise _invalid_value(
+                    coerced,
+                    key=key,
+                    template_id=template_id,
+                    expected=f"Minimum allowed value is {min_value}.",
+                )
+            if max_value is not None and coerced > max_value:
+                raise _invalid_value(
+                    coerced,
+                    key=key,
+                    template_id=template_id,
+                    expected=f"Maximum allowed value is {max_value}.",
+                )
+        return coerced
+
+    return coerce_value
+
+
+def _build_param_resolver(spec: TemplateSpec) -> ParamResolver:
+    template_id = spec.template_id
+    indexed = _spec_by_key(spec)
+    coercers = {
+        param.key: _build_param_coercer(param, template_id=template_id) for param in spec.params
+    }
+    targets = {key: (param.key, coercers[param.key]) for key, param in indexed.items()}
+    defaults = {param.key: param.default for param in spec.params if param.has_default}
+    required = tuple(sorted(param.key for param in spec.params if param.required))
+    valid = ", ".join(param.key for param in spec.params)
+
+    def resolve(provided: tuple[tuple[str, Any], ...]) -> dict[str, Any]:
+        resolved = dict(defaults)
+        for key, raw_value in provided:
+            target = targets.get(key)
+            if target is None:
                 msg = (
-                    f"invalid value '{raw_value}' for '{key}' in template '{template_id}'. "
-                    "Expected a boolean (true/false)."
+                    f"unknown parameter '{key}' for template '{template_id}'. "
+                    f"Supported parameters: {valid}."
                 )
                 raise ValueError(msg)
-    elif param.value_type is int:
-        try:
-            coerced = int(raw_value)
-        except (TypeError, ValueError) as exc:
-            msg = (
-                f"invalid value '{raw_value}' for '{key}' in template '{template_id}'. "
-                "Expected an integer."
-            )
-            raise ValueError(msg) from exc
-    elif param.value_type is float:
-        try:
-            coerced = float(raw_value)
-        except (TypeError, ValueError) as exc:
+            param_key, coerce_value = target
+            resolved[param_key] = coerce_value(raw_value)
+
+        missing = [key for key in required if key not in resolved]
+        if missing:
             msg = (
-                f"invalid value '{raw_value}' for '{key}' in template '{template_id}'. "
-                "Expected a float."
+                f"missing required parameter(s) for template '{template_id}': {', '.join(missing)}."
             )
-            raise ValueError(msg) from exc
-    elif param.value_type is str:
-        coerced = str(raw_value)
-    else:
-        msg = f"unsupported param type '{param.value_type}' for '{key}' in '{template_id}'."
-        raise ValueError(msg)
+            raise ValueError(msg)
+        return resolved
 
-    if param.choices and coerced not in param.choices:
-        choices = ", ".join(str(choice) for choice in param.choices)
-        msg = (
-            f"invalid value '{coerced}' for '{key}' in template '{template_id}'. "
-            f"Valid values: {choices}."
-        )
-        raise ValueError(msg)
+    return resolve
+
+
+@lru_cache(maxsize=128)
+def _compiled_param_resolver(spec: TemplateSpec) -> ParamResolver:
+    return _build_param_resolver(spec)
 
-    if (
-        param.min_value is not None
-        and isinstance(coerced, (int, float))
-        and coerced < param.min_value
-    ):
-        msg = (
-            f"invalid value '{coerced}' for '{key}' in template '{template_id}'. "
-            f"Minimum allowed value is {param.min_value}."
-        )
-        raise ValueError(msg)
-    if (
-        param.max_value is not None
-        and isinstance(coerced, (int, float))
-        and coerced > param.max_value
-    ):
-        msg = (
-            f"invalid value '{coerced}' for '{key}' in template '{template_id}'. "
-            f"Maximum allowed value is {param.max_value}."
-        )
-        raise ValueError(msg)
 
-    return coerced
+def compile_param_resolver(spec: TemplateSpec) -> ParamResolver:
+    """Compile a spec's params into one resolver over provided (key, value) pairs.
+
+    Key indexing, defaults, and per-param coercers are built once per spec, so
+    resolving params only walks the provided pairs.
+    """
+    try:
+        return _compiled_param_resolver(spec)
+    except TypeError:  # unhashable spec, e.g. a list-valued default
+        return _build_param_resolver(spec)
+
+
+@lru_cache(maxsize=256)
+def _resolve_provided_params_cached(
+    spec: TemplateSpec,
+    typed_provided: tuple[tuple[str, type, Any], ...],
+) -> Mapping[str, Any]:
+    provided = tuple((key, raw_value) for key, _, raw_value in typed_provided)
+    return MappingProxyType(compile_param_resolver(spec)(provided))
 
 
 def resolve_template_params(
     *,
     spec: TemplateSpec,
     raw_params: Mapping[str, Any] | None = None,
-) -> dict[str, Any]:
-    """Resolve defaults and apply provided raw params."""
-    indexed = _spec_by_key(spec)
-    defaults: dict[str, Any] = {}
-    required: set[str] = set()
-    for param in spec.params:
-        if param.has_default:
-            defaults[param.key] = param.default
-        if param.required:
-            required.add(param.key)
-
-    resolved = dict(defaults)
-
-    for key, raw_value in (raw_params or {}).items():
-        if raw_value is None:
-            continue
-        if key not in indexed:
-            valid = ", ".join(param.key for param in spec.params)
-            msg = (
-                f"unknown parameter '{key}' for template '{spec.template_id}'. "
-                f"Supported parameters: {valid}."
-            )
-            raise ValueError(msg)
-        param = indexed[key]
-        resolved[param.key] = _coerce_value(param, raw_value, template_id=spec.template_id)
-
-    missing = sorted(key for key in required if key not in resolved)
-    if missing:
-        msg = (
-            f"missing required parameter(s) for template "
-            f"'{spec.template_id}': {', '.join(missing)}."
-        )
-        raise ValueError(msg)
-
-    return resolved
+) -> Mapping[str, Any]:
+    """Resolve defaults and apply provided raw params.
+
+    The result is a read-only mapping shared between calls with the same spec and
+    params; copy it with ``dict(...)`` before mutating.
+    """
+    provided = tuple(
+        (key, raw_value) for key, raw_value in (raw_params or {}).items() if raw_value is not None
+    )
+    # Equal values of different types (1 vs 1.0) can coerce differently, so the
+    # value type is part of the cache key.
+    typed_provided = tuple((key, type(raw_value), raw_value) for key, raw_value in provided)
+    try:
+        hash((spec, typed_provided))
+    except TypeError:
+        return MappingProxyType(compile_param_resolver(spec)(provided))
+    return _resolve_provided_params_cached(spec, typed_provided)
@@ -2,27 +2,48 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 from .contracts import TemplateSpec
+from .params import compile_param_resolver
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TemplateRegistry:
     """In-memory registry of template specs."""
 
     _specs: dict[str, TemplateSpec] = field(default_factory=dict)
-    _aliases: dict[str, str] = field(default_factory=dict)
+    # Template ids and aliases both map to the canonical template id.
+    _all_keys: dict[str, str] = field(default_factory=dict)
 
     def register(self, spec: TemplateSpec) -> None:
+        self.register_many((spec,))
+
+    def register_many(self, specs: Iterable[TemplateSpec]) -> None:
+        """Register specs as one batch; if any spec is invalid, none are registered."""
+        staged_specs: dict[str, TemplateSpec] = {}
+        staged_keys: dict[str, str] = {}
+        for spec in specs:
+            self._stage(spec, staged_specs=staged_specs, staged_keys=staged_keys)
+        self._specs.update(staged_specs)
+        self._all_keys.update(staged_keys)
+
+    def _stage(
+        self,
+        spec: TemplateSpec,
+        *,
+        staged_specs: dict[str, TemplateSpec],
+        staged_keys: dict[str, str],
+    ) -> None:
         template_id = spec.template_id.strip()
         if not template_id:
             msg = "template_id cannot be empty."
             raise ValueError(msg)
-        if template_id in self._specs:
+        if template_id in self._specs or template_id in staged_specs:
             msg = f"template '{template_id}' is already registered."
             raise ValueError(msg)
-        if template_id in self._aliases:
+        if template_id in self._all_keys or template_id in staged_keys:
             msg = f"template id '{template_id}' conflicts with an existing alias."
             raise ValueError(msg)
 
@@ -35,24 +56,23 @@ class TemplateRegistry:
             if alias_key == template_id:
                 msg = f"alias '{alias_key}' duplicates template id '{template_id}'."
                 raise ValueError(msg)
-            if alias_key in self._specs or alias_key in self._aliases:
+            if alias_key in self._all_keys or alias_key in staged_keys:
                 msg = f"template alias '{alias_key}' is already registered."
                 raise ValueError(msg)
             alias_keys.append(alias_key)
 
-        self._specs[template_id] = spec
-        for alias_key in alias_keys:
-            self._aliases[alias_key] = template_id
+        # Compile param coercion up front so bad param specs fail at registration.
+        compile_param_resolver(spec)
 
-    def register_many(self, specs: tuple[TemplateSpec, ...] | list[TemplateSpec]) -> None:
-        for spec in specs:
-            self.register(spec)
+        staged_specs[template_id] = spec
+        staged_keys[template_id] = template_id
+        for alias_key in alias_keys:
+            staged_keys[alias_key] = template_id
 
     def resolve_id(self, template: str) -> str:
-        if template in self._specs:
-            return template
-        if template in self._aliases:
-            return self._aliases[template]
+        template_id = self._all_keys.get(template)
+        if template_id is not None:
+            return template_id
         valid = ", ".join(sorted(self.template_ids()))
         msg = f"unknown template '{template}'. Valid templates: {valid}."
         raise ValueError(msg)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from math import ceil, floor
 
 from .profiles import DeviceProfile
 from .template_layout import (
@@ -13,7 +15,7 @@ from .template_layout import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rect:
     """Rectangle in device units."""
 
@@ -31,7 +33,7 @@ class Rect:
         return self.y + self.height
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RowBounds:
     """Top/center/bottom row bounds."""
 
@@ -40,7 +42,7 @@ class RowBounds:
     bottom: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScheduleGeometry:
     """Computed geometry for schedule template body."""
 
@@ -54,7 +56,7 @@ class ScheduleGeometry:
     writing_right_padding: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DayAtGlanceGeometry:
     """Computed geometry for full day-at-glance template."""
 
@@ -90,7 +92,7 @@ class DayAtGlanceGeometry:
     notes_padding: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DayAtGlanceCompactGeometry:
     """Computed geometry for compact day-at-glance template."""
 
@@ -123,7 +125,7 @@ class DayAtGlanceCompactGeometry:
     notes_step: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChecklistGeometry:
     """Computed geometry for checklist-style templates."""
 
@@ -149,6 +151,17 @@ def schedule_hours(
     return hours
 
 
+def _last_step_index(span: float, *, include_end: bool) -> int:
+    """Return the last step index within ``span`` steps of the start.
+
+    The end is excluded unless include_end, with a relative tolerance of 1e-9
+    steps either way.
+    """
+    if include_end:
+        return floor(span + 1e-9)
+    return ceil(span - 1e-9) - 1
+
+
 def ascending_step_positions(
     *,
     start: float,
@@ -157,18 +170,18 @@ def ascending_step_positions(
     include_start: bool = False,
     include_end: bool = False,
 ) -> tuple[float, ...]:
-    """Return ascending positions with a fixed step."""
+    """Return ascending positions with a fixed step.
+
+    Positions are computed as ``start + index * step`` so rounding error does
+    not accumulate across long runs of ticks.
+    """
     if step <= 0:
         msg = "step must be positive."
         raise ValueError(msg)
 
-    positions: list[float] = []
-    pos = start if include_start else start + step
-    epsilon = step * 1e-9
-    while pos < end - epsilon or (include_end and abs(pos - end) <= epsilon):
-        positions.append(pos)
-        pos += step
-    return tuple(positions)
+    last_index = _last_step_index((end - start) / step, include_end=include_end)
+    first_index = 0 if include_start else 1
+    return tuple(start + (index * step) for index in range(first_index, last_index + 1))
 
 
 def descending_step_positions(
@@ -179,18 +192,36 @@ def descending_step_positions(
     include_start: bool = False,
     include_end: bool = False,
 ) -> tuple[float, ...]:
-    """Return descending positions with a fixed step."""
+    """Return descending positions with a fixed step.
+
+    Positions are computed as ``start - index * step`` so rounding error does
+    not accumulate across long runs of ticks.
+    """
     if step <= 0:
         msg = "step must be positive."
         raise ValueError(msg)
 
-    positions: list[float] = []
-    pos = start if include_start else start - step
-    epsilon = step * 1e-9
-    while pos > end + epsilon or (include_end and abs(pos - end) <= epsilon):
-        positions.append(pos)
-        pos -= step
-    return tuple(positions)
+    last_index = _last_step_index((start - end) / step, include_end=include_end)
+    first_index = 0 if include_start else 1
+    return tuple(start - (index * step) for index in range(first_index, last_index + 1))
+
+
+@lru_cache(maxsize=64)
+def stacked_row_bounds(*, top: float, row_height: float, count: int) -> tuple[RowBounds, ...]:
+    """Return bounds for ``count`` equal-height rows stacked down from ``top``.
+
+    Matches the per-index ``*_row_bounds`` helpers, without their per-call
+    index validation. Results are cached, since pages drawn with the same
+    device and layout ask for the same rows.
+    """
+    half_height = row_height / 2
+    rows: list[RowBounds] = []
+    for index in range(count):
+        row_top = top - (index * row_height)
+        rows.append(
+            RowBounds(top=row_top, center=row_top - half_height, bottom=row_top - row_height)
+        )
+    return tuple(rows)
 
 
 def compute_schedule_geometry(
@@ -396,11 +427,11 @@ def compute_day_at_glance_compact_geometry(
     schedule_height = content_height * 0.31
     notes_height = content_height - priorities_height - schedule_height
     min_notes_height = pt_to_device_units(110, device=device)
-    if notes_height < min_notes_height:
-        deficit = min_notes_height - notes_height
-        reduce_from_schedule = min(deficit, schedule_height * 0.20)
-        schedule_height -= reduce_from_schedule
-        notes_height += reduce_from_schedule
+    # Borrow up to 20% of the schedule height when notes fall short of the minimum.
+    deficit = max(0.0, min_notes_height - notes_height)
+    reduce_from_schedule = min(deficit, schedule_height * 0.20)
+    schedule_height -= reduce_from_schedule
+    notes_height += reduce_from_schedule
 
     priorities_top = content_top
     priorities_bottom = priorities_top - priorities_height
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, replace
+from functools import lru_cache
+from types import MappingProxyType
 
+from .caching import identity_memo
 from .profiles import DEFAULT_DEVICE, DEVICE_PROFILES, DeviceProfile
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TemplateLayoutProfile:
     """Logical layout parameters shared across template types."""
 
@@ -67,77 +71,137 @@ TEMPLATE_LAYOUT_PROFILES = {
 }
 
 
-DEFAULT_TEMPLATE_LAYOUT_BY_DEVICE = {
-    "remarkable": "balanced",
-    "scribe": "full",
-    "palma": "compact",
-}
+# Read-only: resolved layouts are cached, so these defaults must not change at runtime.
+DEFAULT_TEMPLATE_LAYOUT_BY_DEVICE: Mapping[str, str] = MappingProxyType(
+    {
+        "remarkable": "balanced",
+        "scribe": "full",
+        "palma": "compact",
+    }
+)
 
 
-DEFAULT_TEMPLATE_LAYOUT_OVERRIDES_BY_DEVICE = {
-    "palma": {
-        "margin_mm": 3.0,
-        "schedule_start_hour": 9,
-        "schedule_end_hour": 19,
-    },
-}
+DEFAULT_TEMPLATE_LAYOUT_OVERRIDES_BY_DEVICE: Mapping[str, Mapping[str, float | int]] = (
+    MappingProxyType(
+        {
+            "palma": MappingProxyType(
+                {
+                    "margin_mm": 3.0,
+                    "schedule_start_hour": 9,
+                    "schedule_end_hour": 19,
+                }
+            ),
+        }
+    )
+)
 
 
-def mm_to_device_units(value_mm: float, *, device: DeviceProfile) -> float:
-    """Convert physical millimeters into device canvas units."""
+@dataclass(frozen=True, slots=True)
+class DeviceUnitScales:
+    """Multipliers from physical/typographic units to one device's canvas units."""
+
+    mm: float
+    pt: float
+    font_pt: float
+
+
+@identity_memo
+def device_unit_scales(device: DeviceProfile) -> DeviceUnitScales:
+    """Return the (cached) mm, pt, and font pt scale factors for one device.
+
+    Callers converting many values for the same device can bind these once
+    instead of calling the ``*_to_device_units`` helpers per value.
+    """
     if device.pixels_per_inch <= 0:
         msg = "device pixels_per_inch must be positive."
         raise ValueError(msg)
-    return (value_mm / 25.4) * device.pixels_per_inch
+    pt_scale = device.pixels_per_inch / 72.0
+    return DeviceUnitScales(
+        mm=device.pixels_per_inch / 25.4,
+        pt=pt_scale,
+        font_pt=pt_scale * device.template_font_scale,
+    )
+
+
+def mm_to_device_units(value_mm: float, *, device: DeviceProfile) -> float:
+    """Convert physical millimeters into device canvas units."""
+    return value_mm * device_unit_scales(device).mm
 
 
 def pt_to_device_units(value_pt: float, *, device: DeviceProfile) -> float:
     """Convert typographic points into device canvas units."""
-    if device.pixels_per_inch <= 0:
-        msg = "device pixels_per_inch must be positive."
-        raise ValueError(msg)
-    return value_pt * (device.pixels_per_inch / 72.0)
+    return value_pt * device_unit_scales(device).pt
 
 
 def font_pt_to_device_units(value_pt: float, *, device: DeviceProfile) -> float:
     """Convert points into device units with device-specific template text scaling."""
-    return pt_to_device_units(value_pt * device.template_font_scale, device=device)
+    return value_pt * device_unit_scales(device).font_pt
+
+
+# Override keyword names, in resolve_template_layout parameter order.
+_LAYOUT_OVERRIDE_FIELDS = (
+    "margin_mm",
+    "header_height_mm",
+    "line_spacing_mm",
+    "grid_spacing_mm",
+    "dot_spacing_mm",
+    "dot_radius_mm",
+    "checklist_rows",
+    "priorities_rows",
+    "schedule_start_hour",
+    "schedule_end_hour",
+)
+
+_TEMPLATE_LAYOUT_RULES: tuple[tuple[Callable[[TemplateLayoutProfile], bool], str], ...] = (
+    (lambda layout: layout.margin_mm > 0, "template margin must be positive."),
+    (lambda layout: layout.header_height_mm >= 0, "template header height must be >= 0."),
+    (lambda layout: layout.line_spacing_mm > 0, "template line spacing must be positive."),
+    (lambda layout: layout.grid_spacing_mm > 0, "template grid spacing must be positive."),
+    (lambda layout: layout.dot_spacing_mm > 0, "template dot spacing must be positive."),
+    (lambda layout: layout.dot_radius_mm > 0, "template dot radius must be positive."),
+    (lambda layout: layout.checklist_rows >= 1, "template checklist rows must be >= 1."),
+    (lambda layout: layout.priorities_rows >= 1, "template priorities rows must be >= 1."),
+    (
+        lambda layout: 0 <= layout.schedule_start_hour <= 23,
+        "template schedule start hour must be between 0 and 23.",
+    ),
+    (
+        lambda layout: 1 <= layout.schedule_end_hour <= 24,
+        "template schedule end hour must be between 1 and 24.",
+    ),
+    (
+        lambda layout: layout.schedule_end_hour > layout.schedule_start_hour,
+        "template schedule end hour must be greater than start hour.",
+    ),
+)
 
 
 def _validate_template_layout(layout: TemplateLayoutProfile) -> None:
-    if layout.margin_mm <= 0:
-        msg = "template margin must be positive."
-        raise ValueError(msg)
-    if layout.header_height_mm < 0:
-        msg = "template header height must be >= 0."
-        raise ValueError(msg)
-    if layout.line_spacing_mm <= 0:
-        msg = "template line spacing must be positive."
-        raise ValueError(msg)
-    if layout.grid_spacing_mm <= 0:
-        msg = "template grid spacing must be positive."
-        raise ValueError(msg)
-    if layout.dot_spacing_mm <= 0:
-        msg = "template dot spacing must be positive."
-        raise ValueError(msg)
-    if layout.dot_radius_mm <= 0:
-        msg = "template dot radius must be positive."
-        raise ValueError(msg)
-    if layout.checklist_rows < 1:
-        msg = "template checklist rows must be >= 1."
-        raise ValueError(msg)
-    if layout.priorities_rows < 1:
-        msg = "template priorities rows must be >= 1."
-        raise ValueError(msg)
-    if not 0 <= layout.schedule_start_hour <= 23:
-        msg = "template schedule start hour must be between 0 and 23."
-        raise ValueError(msg)
-    if not 1 <= layout.schedule_end_hour <= 24:
-        msg = "template schedule end hour must be between 1 and 24."
-        raise ValueError(msg)
-    if layout.schedule_end_hour <= layout.schedule_start_hour:
-        msg = "template schedule end hour must be greater than start hour."
-        raise ValueError(msg)
+    for is_valid, msg in _TEMPLATE_LAYOUT_RULES:
+        if not is_valid(layout):
+            raise ValueError(msg)
+
+
+def _build_device_layout_base() -> dict[tuple[str, str], TemplateLayoutProfile]:
+    """Apply device default overrides to every built-in layout, validating each once."""
+    base: dict[tuple[str, str], TemplateLayoutProfile] = {}
+    for device_name in DEVICE_PROFILES:
+        device_defaults = DEFAULT_TEMPLATE_LAYOUT_OVERRIDES_BY_DEVICE.get(device_name, {})
+        for layout_name, layout_profile in TEMPLATE_LAYOUT_PROFILES.items():
+            merged = (
+                replace(layout_profile, **device_defaults) if device_defaults else layout_profile
+            )
+            _validate_template_layout(merged)
+            base[(device_name, layout_name)] = merged
+    return base
+
+
+_DEVICE_LAYOUT_BASE = _build_device_layout_base()
+
+_VALID_DEVICES = frozenset(DEVICE_PROFILES)
+_VALID_DEVICES_TEXT = ", ".join(sorted(DEVICE_PROFILES))
+_VALID_LAYOUTS = frozenset(TEMPLATE_LAYOUT_PROFILES)
+_VALID_LAYOUTS_TEXT = ", ".join(sorted(TEMPLATE_LAYOUT_PROFILES))
 
 
 def resolve_template_layout(
@@ -156,37 +220,71 @@ def resolve_template_layout(
     schedule_end_hour: int | None = None,
 ) -> TemplateLayoutProfile:
     """Resolve a template layout profile and apply optional parameter overrides."""
-    if device not in DEVICE_PROFILES:
-        msg = f"unknown device '{device}'. Valid devices: {', '.join(sorted(DEVICE_PROFILES))}."
+    return _resolve_template_layout_cached(
+        device,
+        layout,
+        margin_mm,
+        header_height_mm,
+        line_spacing_mm,
+        grid_spacing_mm,
+        dot_spacing_mm,
+        dot_radius_mm,
+        checklist_rows,
+        priorities_rows,
+        schedule_start_hour,
+        schedule_end_hour,
+    )
+
+
+@lru_cache(maxsize=128, typed=True)
+def _resolve_template_layout_cached(
+    device: str,
+    layout: str | None,
+    margin_mm: float | None,
+    header_height_mm: float | None,
+    line_spacing_mm: float | None,
+    grid_spacing_mm: float | None,
+    dot_spacing_mm: float | None,
+    dot_radius_mm: float | None,
+    checklist_rows: int | None,
+    priorities_rows: int | None,
+    schedule_start_hour: int | None,
+    schedule_end_hour: int | None,
+) -> TemplateLayoutProfile:
+    if device not in _VALID_DEVICES:
+        msg = f"unknown device '{device}'. Valid devices: {_VALID_DEVICES_TEXT}."
         raise ValueError(msg)
 
     layout_name = layout or DEFAULT_TEMPLATE_LAYOUT_BY_DEVICE[device]
-    if layout_name not in TEMPLATE_LAYOUT_PROFILES:
+    if layout_name not in _VALID_LAYOUTS:
         msg = (
             f"unknown template layout '{layout_name}'. Valid template layouts: "
-            f"{', '.join(sorted(TEMPLATE_LAYOUT_PROFILES))}."
+            f"{_VALID_LAYOUTS_TEXT}."
         )
         raise ValueError(msg)
 
-    device_defaults = DEFAULT_TEMPLATE_LAYOUT_OVERRIDES_BY_DEVICE.get(device, {})
+    base = _DEVICE_LAYOUT_BASE[(device, layout_name)]
+    override_values = (
+        margin_mm,
+        header_height_mm,
+        line_spacing_mm,
+        grid_spacing_mm,
+        dot_spacing_mm,
+        dot_radius_mm,
+        checklist_rows,
+        priorities_rows,
+        schedule_start_hour,
+        schedule_end_hour,
+    )
+    if all(value is None for value in override_values):
+        return base
+
     overrides = {
         key: value
-        for key, value in {
-            "margin_mm": margin_mm,
-            "header_height_mm": header_height_mm,
-            "line_spacing_mm": line_spacing_mm,
-            "grid_spacing_mm": grid_spacing_mm,
-            "dot_spacing_mm": dot_spacing_mm,
-            "dot_radius_mm": dot_radius_mm,
-            "checklist_rows": checklist_rows,
-            "priorities_rows": priorities_rows,
-            "schedule_start_hour": schedule_start_hour,
-            "schedule_end_hour": schedule_end_hour,
-        }.items()
+        for key, value in zip(_LAYOUT_OVERRIDE_FIELDS, override_values, strict=True)
         if value is not None
     }
-    selected = replace(TEMPLATE_LAYOUT_PROFILES[layout_name], **device_defaults)
-    selected = replace(selected, **overrides)
+    selected = replace(base, **overrides)
     _validate_template_layout(selected)
     return selected
 
@@ -2,28 +2,31 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from functools import partial
+from math import ceil
+
+from reportlab.lib import colors
 
 from .config import Theme
 from .drawing import DrawingPrimitives
 from .profiles import DeviceProfile
 from .template_geometry import (
     ascending_step_positions,
-    checklist_row_bounds,
-    compact_priorities_row_bounds,
-    compact_schedule_row_bounds,
     compute_checklist_geometry,
     compute_day_at_glance_compact_geometry,
     compute_day_at_glance_geometry,
     compute_schedule_geometry,
-    day_at_glance_priorities_row_bounds,
-    day_at_glance_schedule_row_bounds,
     descending_step_positions,
-    schedule_row_bounds,
+    stacked_row_bounds,
 )
 from .template_layout import (
+    DeviceUnitScales,
     TemplateLayoutProfile,
     content_bounds,
+    device_unit_scales,
     font_pt_to_device_units,
     mm_to_device_units,
     pt_to_device_units,
@@ -40,44 +43,64 @@ TEMPLATE_FINE_RULE_WIDTH_MM = 0.12
 TEMPLATE_DIVIDER_WIDTH_MM = 0.32
 
 
+@dataclass(frozen=True, slots=True)
+class StrokeMetrics:
+    """Template stroke widths converted to device units once per render."""
+
+    border: float
+    rule: float
+    fine: float
+    divider: float
+
+
+def _stroke_metrics(device: DeviceProfile) -> StrokeMetrics:
+    mm = device_unit_scales(device).mm
+    return StrokeMetrics(
+        border=TEMPLATE_BORDER_WIDTH_MM * mm,
+        rule=TEMPLATE_RULE_WIDTH_MM * mm,
+        fine=TEMPLATE_FINE_RULE_WIDTH_MM * mm,
+        divider=TEMPLATE_DIVIDER_WIDTH_MM * mm,
+    )
+
+
 def _apply_border_stroke(
     pdf: DrawingPrimitives,
     *,
-    device: DeviceProfile,
+    strokes: StrokeMetrics,
     theme: type = Theme,
 ) -> None:
     pdf.set_stroke_color(theme.TEXT_SECONDARY)
-    pdf.set_line_width(mm_to_device_units(TEMPLATE_BORDER_WIDTH_MM, device=device))
+    pdf.set_line_width(strokes.border)
 
 
 def _apply_rule_stroke(
     pdf: DrawingPrimitives,
     *,
-    device: DeviceProfile,
+    strokes: StrokeMetrics,
     theme: type = Theme,
 ) -> None:
     pdf.set_stroke_color(theme.GRID_LINES)
-    pdf.set_line_width(mm_to_device_units(TEMPLATE_RULE_WIDTH_MM, device=device))
+    pdf.set_line_width(strokes.rule)
 
 
 def _apply_fine_rule_stroke(
     pdf: DrawingPrimitives,
     *,
-    device: DeviceProfile,
+    strokes: StrokeMetrics,
     theme: type = Theme,
 ) -> None:
     pdf.set_stroke_color(theme.GRID_LINES)
-    pdf.set_line_width(mm_to_device_units(TEMPLATE_FINE_RULE_WIDTH_MM, device=device))
+    pdf.set_line_width(strokes.fine)
 
 
 def _apply_divider_stroke(
     pdf: DrawingPrimitives,
     *,
-    device: DeviceProfile,
+    strokes: StrokeMetrics,
     theme: type = Theme,
 ) -> None:
     pdf.set_stroke_color(theme.TEXT_SECONDARY)
-    pdf.set_line_width(mm_to_device_units(TEMPLATE_DIVIDER_WIDTH_MM, device=device))
+    pdf.set_line_width(strokes.divider)
 
 
 def _band_label_baseline(*, top: float, bottom: float, font_size: float) -> float:
@@ -86,6 +109,23 @@ def _band_label_baseline(*, top: float, bottom: float, font_size: float) -> floa
     return bottom + ((band_height - font_size) / 2) + (font_size * 0.2)
 
 
+TextWidth = Callable[[str, str, float], float]
+
+
+def _memoized_string_width(pdf: DrawingPrimitives) -> TextWidth:
+    """Return a ``string_width`` that measures each (text, font, size) only once."""
+    widths: dict[tuple[str, str, float], float] = {}
+
+    def measure(text: str, font_name: str, size: float) -> float:
+        key = (text, font_name, size)
+        width = widths.get(key)
+        if width is None:
+            width = widths[key] = pdf.string_width(text, font_name, size)
+        return width
+
+    return measure
+
+
 def _fit_font_size_to_width(
     pdf: DrawingPrimitives,
     *,
@@ -94,39 +134,66 @@ def _fit_font_size_to_width(
     preferred_size: float,
     min_size: float,
     max_width: float,
+    measure: TextWidth | None = None,
 ) -> float:
-    """Return a font size that keeps text width within max_width."""
+    """Return a font size that keeps text width within max_width.
+
+    Sizes step down from preferred_size in 0.5pt increments. Text width is
+    proportional to size, so the width at preferred_size predicts the largest
+    step that fits; the prediction is confirmed by measuring it and the step
+    above, with bisection as the fallback for backends that are not exactly
+    proportional.
+    """
     if max_width <= 0:
         return min_size
 
+    string_width = measure or _memoized_string_width(pdf)
+    sizes: list[float] = []
     size = preferred_size
-    while size > min_size and pdf.string_width(text, font_name, size) > max_width:
+    while size > min_size:
+        sizes.append(size)
         size -= 0.5
-    if size < min_size:
+    if not sizes:
         return min_size
-    return size
+
+    preferred_width = string_width(text, font_name, sizes[0])
+    if preferred_width <= max_width:
+        return sizes[0]
+
+    def fits(candidate: float) -> bool:
+        return string_width(text, font_name, candidate) <= max_width
+
+    guess = ceil((sizes[0] - (sizes[0] * max_width / preferred_width)) / 0.5)
+    if guess >= len(sizes):
+        if not fits(sizes[-1]):
+            return min_size
+    elif fits(sizes[guess]) and not fits(sizes[guess - 1]):
+        return sizes[guess]
+
+    index = bisect_left(sizes, True, lo=1, key=fits)
+    if index == len(sizes):
+        return min_size
+    return sizes[index]
 
 
 def _pick_fitting_label(
     pdf: DrawingPrimitives,
     *,
-    candidates: Sequence[str],
+    candidates: Iterable[str],
     font_name: str,
     preferred_size: float,
     min_size: float,
     max_width: float,
+    measure: TextWidth | None = None,
 ) -> tuple[str, float]:
-    """Pick the first label candidate that fits the available width."""
-    fallback_label = candidates[-1]
-    fallback_size = _fit_font_size_to_width(
-        pdf,
-        text=fallback_label,
-        font_name=font_name,
-        preferred_size=preferred_size,
-        min_size=min_size,
-        max_width=max_width,
-    )
-
+    """Pick the first label candidate that fits the available width.
+
+    Candidates are consumed lazily, so later ones are never built or measured
+    once one fits. Falls back to the last candidate at its fitted size.
+    """
+    measure = measure or _memoized_string_width(pdf)
+    label: str | None = None
+    fitted_size = min_size
     for label in candidates:
         fitted_size = _fit_font_size_to_width(
             pdf,
@@ -135,27 +202,92 @@ def _pick_fitting_label(
             preferred_size=preferred_size,
             min_size=min_size,
             max_width=max_width,
+            measure=measure,
         )
-        if pdf.string_width(label, font_name, fitted_size) <= max_width:
+        if measure(label, font_name, fitted_size) <= max_width:
             return (label, fitted_size)
-    return (fallback_label, fallback_size)
+    if label is None:
+        msg = "at least one label candidate is required."
+        raise ValueError(msg)
+    return (label, fitted_size)
+
 
+_TITLE_SHORTENINGS = ((" AT A ", " "), (" & ", "/"), (" ", ""))
 
-def _title_candidates(title: str) -> tuple[str, ...]:
-    """Return progressively shorter title candidates."""
-    variants: list[str] = [title]
-    if " AT A " in title:
-        variants.append(title.replace(" AT A ", " "))
-    if " & " in title:
-        variants.append(title.replace(" & ", "/"))
-    if " " in title:
-        variants.append(title.replace(" ", ""))
 
-    deduped: list[str] = []
-    for variant in variants:
-        if variant not in deduped:
-            deduped.append(variant)
-    return tuple(deduped)
+def _title_candidates(title: str) -> Iterator[str]:
+    """Yield progressively shorter title candidates, skipping duplicates."""
+    yield title
+    seen = {title}
+    for old, new in _TITLE_SHORTENINGS:
+        if old in title:
+            variant = title.replace(old, new)
+            if variant not in seen:
+                seen.add(variant)
+                yield variant
+
+
+@dataclass(frozen=True, slots=True)
+class HeaderLabels:
+    """Fitted header title and date labels for one content width."""
+
+    title: str
+    title_font_size: float
+    date: str
+    date_font_size: float
+    date_width: float
+
+
+def _header_date_line_width(content_width: float, *, scales: DeviceUnitScales) -> float:
+    return max(24 * scales.pt, min(72 * scales.pt, content_width * 0.22))
+
+
+def _fit_header_labels(
+    pdf: DrawingPrimitives,
+    *,
+    title: str,
+    font_name: str,
+    scales: DeviceUnitScales,
+    content_width: float,
+) -> HeaderLabels:
+    """Return the header title and date labels fitted to content_width.
+
+    Widths are measured through one memo shared by both labels, so each string
+    is measured at most once per header.
+    """
+    measure = _memoized_string_width(pdf)
+    date_label, date_font_size = _pick_fitting_label(
+        pdf,
+        candidates=("DATE", "DT"),
+        font_name=font_name,
+        preferred_size=10 * scales.font_pt,
+        min_size=6 * scales.font_pt,
+        max_width=max(content_width * 0.16, 22 * scales.pt),
+        measure=measure,
+    )
+    date_width = measure(date_label, font_name, date_font_size)
+    label_gap = 8 * scales.pt
+    title_date_gap = 10 * scales.pt
+    date_block_width = (
+        date_width + label_gap + _header_date_line_width(content_width, scales=scales)
+    )
+    title_max_width = max(content_width - date_block_width - title_date_gap, content_width * 0.35)
+    title_label, title_font_size = _pick_fitting_label(
+        pdf,
+        candidates=_title_candidates(title),
+        font_name=font_name,
+        preferred_size=12 * scales.font_pt,
+        min_size=7 * scales.font_pt,
+        max_width=title_max_width,
+        measure=measure,
+    )
+    return HeaderLabels(
+        title=title_label,
+        title_font_size=title_font_size,
+        date=date_label,
+        date_font_size=date_font_size,
+        date_width=date_width,
+    )
 
 
 def draw_page_background(
@@ -164,6 +296,9 @@ def draw_page_background(
     *,
     theme: type = Theme,
 ) -> None:
+    # PDF pages are white unless painted, so a white background needs no fill.
+    if theme.BACKGROUND == colors.white:
+        return
     pdf.set_fill_color(theme.BACKGROUND)
     pdf.rect(0, 0, device.page_width, device.page_height, fill=1, stroke=0)
 
@@ -172,6 +307,7 @@ def _draw_header(
     pdf: DrawingPrimitives,
     *,
     device: DeviceProfile,
+    strokes: StrokeMetrics,
     left: float,
     right: float,
     top: float,
@@ -183,48 +319,30 @@ def _draw_header(
         return top
 
     header_bottom = top - header_height
-    _apply_border_stroke(pdf, device=device, theme=theme)
+    _apply_border_stroke(pdf, strokes=strokes, theme=theme)
     pdf.line(left, header_bottom, right, header_bottom)
 
+    scales = device_unit_scales(device)
     content_width = right - left
-    date_line_width = max(
-        pt_to_device_units(24, device=device),
-        min(pt_to_device_units(72, device=device), content_width * 0.22),
-    )
-    label_gap = pt_to_device_units(8, device=device)
-    title_date_gap = pt_to_device_units(10, device=device)
-
-    date_label, date_font_size = _pick_fitting_label(
-        pdf,
-        candidates=("DATE", "DT"),
-        font_name=theme.FONT_BOLD,
-        preferred_size=font_pt_to_device_units(10, device=device),
-        min_size=font_pt_to_device_units(6, device=device),
-        max_width=max(content_width * 0.16, pt_to_device_units(22, device=device)),
-    )
-    label_width = pdf.string_width(date_label, theme.FONT_BOLD, date_font_size)
-    date_block_width = label_width + label_gap + date_line_width
-    title_max_width = max(content_width - date_block_width - title_date_gap, content_width * 0.35)
-    title_label, title_font_size = _pick_fitting_label(
+    labels = _fit_header_labels(
         pdf,
-        candidates=_title_candidates(title),
+        title=title,
         font_name=theme.FONT_BOLD,
-        preferred_size=font_pt_to_device_units(12, device=device),
-        min_size=font_pt_to_device_units(7, device=device),
-        max_width=title_max_width,
+        scales=scales,
+        content_width=content_width,
     )
 
     pdf.set_fill_color(theme.TEXT_PRIMARY)
-    pdf.set_font(theme.FONT_BOLD, title_font_size)
+    pdf.set_font(theme.FONT_BOLD, labels.title_font_size)
     text_y = header_bottom + (header_height * 0.42)
-    pdf.draw_string(left, text_y, title_label)
+    pdf.draw_string(left, text_y, labels.title)
 
     pdf.set_fill_color(theme.TEXT_SECONDARY)
-    pdf.set_font(theme.FONT_BOLD, date_font_size)
+    pdf.set_font(theme.FONT_BOLD, labels.date_font_size)
     line_right = right
-    line_left = line_right - date_line_width
-    pdf.draw_string(line_left - label_width - label_gap, text_y, date_label)
-    _apply_rule_stroke(pdf, device=device, theme=theme)
+    line_left = line_right - _header_date_line_width(content_width, scales=scales)
+    pdf.draw_string(line_left - labels.date_width - (8 * scales.pt), text_y, labels.date)
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
     pdf.line(line_left, text_y, line_right, text_y)
     return header_bottom
 
@@ -237,9 +355,11 @@ def _draw_lines_template(
     theme: type = Theme,
 ) -> None:
     left, bottom, right, top = content_bounds(device, layout)
+    strokes = _stroke_metrics(device)
     header_bottom = _draw_header(
         pdf,
         device=device,
+        strokes=strokes,
         left=left,
         right=right,
         top=top,
@@ -248,15 +368,15 @@ def _draw_lines_template(
         theme=theme,
     )
 
-    _apply_rule_stroke(pdf, device=device, theme=theme)
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
     step = mm_to_device_units(layout.line_spacing_mm, device=device)
-    for y_pos in descending_step_positions(
+    y_positions = descending_step_positions(
         start=header_bottom,
         end=bottom,
         step=step,
         include_end=True,
-    ):
-        pdf.line(left, y_pos, right, y_pos)
+    )
+    pdf.lines([(left, y_pos, right, y_pos) for y_pos in y_positions])
 
 
 def _draw_grid_template(
@@ -267,9 +387,11 @@ def _draw_grid_template(
     theme: type = Theme,
 ) -> None:
     left, bottom, right, top = content_bounds(device, layout)
+    strokes = _stroke_metrics(device)
     header_bottom = _draw_header(
         pdf,
         device=device,
+        strokes=strokes,
         left=left,
         right=right,
         top=top,
@@ -279,25 +401,27 @@ def _draw_grid_template(
     )
 
     step = mm_to_device_units(layout.grid_spacing_mm, device=device)
-    _apply_fine_rule_stroke(pdf, device=device, theme=theme)
+    _apply_fine_rule_stroke(pdf, strokes=strokes, theme=theme)
 
-    for x_pos in ascending_step_positions(
+    x_positions = ascending_step_positions(
         start=left,
         end=right,
         step=step,
         include_start=True,
         include_end=True,
-    ):
-        pdf.line(x_pos, bottom, x_pos, header_bottom)
-
-    for y_pos in descending_step_positions(
+    )
+    y_positions = descending_step_positions(
         start=header_bottom,
         end=bottom,
         step=step,
         include_start=True,
         include_end=True,
-    ):
-        pdf.line(left, y_pos, right, y_pos)
+    )
+    # Both axes share one stroke style, so they go out as a single path.
+    pdf.lines(
+        [(x_pos, bottom, x_pos, header_bottom) for x_pos in x_positions]
+        + [(left, y_pos, right, y_pos) for y_pos in y_positions]
+    )
 
 
 def _draw_dotted_grid_template(
@@ -308,9 +432,11 @@ def _draw_dotted_grid_template(
     theme: type = Theme,
 ) -> None:
     left, bottom, right, top = content_bounds(device, layout)
+    strokes = _stroke_metrics(device)
     header_bottom = _draw_header(
         pdf,
         device=device,
+        strokes=strokes,
         left=left,
         right=right,
         top=top,
@@ -323,22 +449,22 @@ def _draw_dotted_grid_template(
     y_step = mm_to_device_units(layout.dot_spacing_mm, device=device)
     dot_radius = mm_to_device_units(layout.dot_radius_mm, device=device)
 
-    pdf.set_fill_color(theme.GRID_LINES)
-    for y_pos in ascending_step_positions(
+    x_positions = ascending_step_positions(
+        start=left,
+        end=right,
+        step=x_step,
+        include_start=True,
+        include_end=True,
+    )
+    y_positions = ascending_step_positions(
         start=bottom,
         end=header_bottom,
         step=y_step,
         include_start=True,
         include_end=True,
-    ):
-        for x_pos in ascending_step_positions(
-            start=left,
-            end=right,
-            step=x_step,
-            include_start=True,
-            include_end=True,
-        ):
-            pdf.circle(x_pos, y_pos, dot_radius, fill=1, stroke=0)
+    )
+    pdf.set_fill_color(theme.GRID_LINES)
+    pdf.circles(((x, y) for y in y_positions for x in x_positions), dot_radius, fill=1, stroke=0)
 
 
 def _draw_schedule_template(
@@ -349,9 +475,11 @@ def _draw_schedule_template(
     theme: type = Theme,
 ) -> None:
     left, bottom, right, top = content_bounds(device, layout)
+    strokes = _stroke_metrics(device)
     header_bottom = _draw_header(
         pdf,
         device=device,
+        strokes=strokes,
         left=left,
         right=right,
         top=top,
@@ -370,7 +498,7 @@ def _draw_schedule_template(
         work_start_hour=SCHEDULE_TEMPLATE_WORK_START_HOUR,
         work_end_hour=SCHEDULE_TEMPLATE_WORK_END_HOUR,
     )
-    _apply_border_stroke(pdf, device=device, theme=theme)
+    _apply_border_stroke(pdf, strokes=strokes, theme=theme)
     pdf.rect(
         geometry.body.x,
         geometry.body.y,
@@ -391,33 +519,39 @@ def _draw_schedule_template(
             stroke=0,
         )
 
-    _apply_rule_stroke(pdf, device=device, theme=theme)
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
     hour_col_x = geometry.body.x + geometry.hour_col_width
     pdf.line(hour_col_x, geometry.body.y, hour_col_x, geometry.body.top)
 
-    for idx, hour_value in enumerate(geometry.hours):
-        row = schedule_row_bounds(geometry, idx)
-
-        if idx > 0:
-            _apply_rule_stroke(pdf, device=device, theme=theme)
-            pdf.line(geometry.body.x, row.top, geometry.body.right, row.top)
-
-        pdf.set_fill_color(theme.TEXT_SECONDARY)
-        pdf.set_font(theme.FONT_BOLD, geometry.hour_font_size)
-        pdf.draw_centred_string(
-            geometry.body.x + (geometry.hour_col_width / 2),
-            row.center - (geometry.hour_font_size * 0.33),
-            f"{hour_value:02d}",
-        )
+    # Rows are drawn in one pass per stroke style; rule separators go last so
+    # they still sit on top of the fine bottom lines they share a y with.
+    rows = stacked_row_bounds(
+        top=geometry.body.top, row_height=geometry.row_height, count=len(geometry.hours)
+    )
+    _apply_fine_rule_stroke(pdf, strokes=strokes, theme=theme)
+    writing_left = geometry.body.x + geometry.hour_col_width + geometry.writing_left_padding
+    writing_right = geometry.body.right - geometry.writing_right_padding
+    fine_segments: list[tuple[float, float, float, float]] = []
+    for row in rows:
+        fine_segments.append((writing_left, row.center, writing_right, row.center))
+        fine_segments.append((geometry.body.x, row.bottom, geometry.body.right, row.bottom))
+    pdf.lines(fine_segments)
+
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
+    pdf.lines([(geometry.body.x, row.top, geometry.body.right, row.top) for row in rows[1:]])
 
-        _apply_fine_rule_stroke(pdf, device=device, theme=theme)
-        pdf.line(
-            geometry.body.x + geometry.hour_col_width + geometry.writing_left_padding,
-            row.center,
-            geometry.body.right - geometry.writing_right_padding,
-            row.center,
-        )
-        pdf.line(geometry.body.x, row.bottom, geometry.body.right, row.bottom)
+    pdf.set_fill_color(theme.TEXT_SECONDARY)
+    pdf.set_font(theme.FONT_BOLD, geometry.hour_font_size)
+    label_x = geometry.body.x + (geometry.hour_col_width / 2)
+    baseline_offset = geometry.hour_font_size * 0.33
+    pdf.draw_centred_strings(
+        (
+            (label_x, row.center - baseline_offset, f"{hour_value:02d}")
+            for row, hour_value in zip(rows, geometry.hours, strict=True)
+        ),
+        font_name=theme.FONT_BOLD,
+        size=geometry.hour_font_size,
+    )
 
 
 def _draw_day_at_glance_template(
@@ -432,9 +566,11 @@ def _draw_day_at_glance_template(
         return
 
     left, bottom, right, top = content_bounds(device, layout)
+    strokes = _stroke_metrics(device)
     header_bottom = _draw_header(
         pdf,
         device=device,
+        strokes=strokes,
         left=left,
         right=right,
         top=top,
@@ -452,7 +588,7 @@ def _draw_day_at_glance_template(
         header_bottom=header_bottom,
     )
 
-    _apply_border_stroke(pdf, device=device, theme=theme)
+    _apply_border_stroke(pdf, strokes=strokes, theme=theme)
     pdf.rect(
         geometry.schedule_left,
         geometry.bottom,
@@ -511,11 +647,9 @@ def _draw_day_at_glance_template(
         tasks_label,
     )
 
-    _apply_rule_stroke(pdf, device=device, theme=theme)
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
     pdf.line(geometry.schedule_left, geometry.grid_top, geometry.schedule_right, geometry.grid_top)
     pdf.line(geometry.right_left, geometry.grid_top, right, geometry.grid_top)
-
-    _apply_rule_stroke(pdf, device=device, theme=theme)
     pdf.line(
         geometry.schedule_left + geometry.label_col_width,
         geometry.bottom,
@@ -523,33 +657,40 @@ def _draw_day_at_glance_template(
         geometry.grid_top,
     )
 
-    for idx in range(geometry.hour_count):
-        row = day_at_glance_schedule_row_bounds(geometry, idx)
-        hour_value = layout.schedule_start_hour + idx
-
-        if idx > 0:
-            _apply_rule_stroke(pdf, device=device, theme=theme)
-            pdf.line(geometry.schedule_left, row.top, geometry.schedule_right, row.top)
-
-        pdf.set_fill_color(theme.TEXT_SECONDARY)
-        pdf.set_font(theme.FONT_BOLD, geometry.hour_font_size)
-        pdf.draw_centred_string(
-            geometry.schedule_left + (geometry.label_col_width / 2),
-            row.center - (geometry.hour_font_size * 0.33),
-            f"{hour_value:02d}",
+    rows = stacked_row_bounds(
+        top=geometry.grid_top, row_height=geometry.row_height, count=geometry.hour_count
+    )
+    _apply_fine_rule_stroke(pdf, strokes=strokes, theme=theme)
+    writing_left = geometry.schedule_left + geometry.label_col_width + geometry.left_line_padding
+    writing_right = geometry.schedule_right - geometry.right_line_padding
+    fine_segments: list[tuple[float, float, float, float]] = []
+    for row in rows:
+        fine_segments.append((writing_left, row.center, writing_right, row.center))
+        fine_segments.append(
+            (geometry.schedule_left, row.bottom, geometry.schedule_right, row.bottom)
         )
+    pdf.lines(fine_segments)
 
-        _apply_fine_rule_stroke(pdf, device=device, theme=theme)
-        pdf.line(
-            geometry.schedule_left + geometry.label_col_width + geometry.left_line_padding,
-            row.center,
-            geometry.schedule_right - geometry.right_line_padding,
-            row.center,
-        )
-        pdf.line(geometry.schedule_left, row.bottom, geometry.schedule_right, row.bottom)
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
+    pdf.lines(
+        [(geometry.schedule_left, row.top, geometry.schedule_right, row.top) for row in rows[1:]]
+    )
+
+    pdf.set_fill_color(theme.TEXT_SECONDARY)
+    pdf.set_font(theme.FONT_BOLD, geometry.hour_font_size)
+    label_x = geometry.schedule_left + (geometry.label_col_width / 2)
+    baseline_offset = geometry.hour_font_size * 0.33
+    pdf.draw_centred_strings(
+        (
+            (label_x, row.center - baseline_offset, f"{layout.schedule_start_hour + idx:02d}")
+            for idx, row in enumerate(rows)
+        ),
+        font_name=theme.FONT_BOLD,
+        size=geometry.hour_font_size,
+    )
 
-    _apply_rule_stroke(pdf, device=device, theme=theme)
     pdf.line(geometry.right_left, geometry.priorities_bottom, right, geometry.priorities_bottom)
+
     pdf.set_fill_color(theme.TEXT_SECONDARY)
     pdf.set_font(theme.FONT_BOLD, geometry.label_font_size)
     priorities_label_y = _band_label_baseline(
@@ -562,30 +703,31 @@ def _draw_day_at_glance_template(
         priorities_label_y,
         "TOP PRIORITIES",
     )
-    _apply_fine_rule_stroke(pdf, device=device, theme=theme)
+    _apply_fine_rule_stroke(pdf, strokes=strokes, theme=theme)
     pdf.line(geometry.right_left, geometry.priorities_rows_top, right, geometry.priorities_rows_top)
 
-    for idx in range(geometry.priorities_rows):
-        row = day_at_glance_priorities_row_bounds(geometry, idx)
+    box_x = geometry.right_left + geometry.label_x_offset
+    priority_rows = stacked_row_bounds(
+        top=geometry.priorities_rows_top,
+        row_height=geometry.priority_row_height,
+        count=geometry.priorities_rows,
+    )
+    task_left = box_x + geometry.task_box_size + geometry.task_line_gap
+    task_right = right - geometry.task_line_gap
+    fine_segments = []
+    for idx, row in enumerate(priority_rows):
         if idx > 0:
-            _apply_fine_rule_stroke(pdf, device=device, theme=theme)
-            pdf.line(geometry.right_left, row.top, right, row.top)
-
-        box_x = geometry.right_left + geometry.label_x_offset
+            fine_segments.append((geometry.right_left, row.top, right, row.top))
+        fine_segments.append((task_left, row.center, task_right, row.center))
+        fine_segments.append((geometry.right_left, row.bottom, right, row.bottom))
+    pdf.lines(fine_segments)
+
+    pdf.set_stroke_color(theme.ACCENT)
+    pdf.set_line_width(strokes.rule)
+    for row in priority_rows:
         box_y = row.center - (geometry.task_box_size / 2)
-        pdf.set_stroke_color(theme.ACCENT)
-        pdf.set_line_width(mm_to_device_units(TEMPLATE_RULE_WIDTH_MM, device=device))
         pdf.rect(box_x, box_y, geometry.task_box_size, geometry.task_box_size, fill=0, stroke=1)
 
-        _apply_fine_rule_stroke(pdf, device=device, theme=theme)
-        pdf.line(
-            box_x + geometry.task_box_size + geometry.task_line_gap,
-            row.center,
-            right - geometry.task_line_gap,
-            row.center,
-        )
-        pdf.line(geometry.right_left, row.bottom, right, row.bottom)
-
     pdf.set_fill_color(theme.TEXT_SECONDARY)
     pdf.set_font(theme.FONT_BOLD, geometry.label_font_size)
     notes_label_y = _band_label_baseline(
@@ -594,22 +736,27 @@ def _draw_day_at_glance_template(
         font_size=geometry.label_font_size,
     )
     pdf.draw_string(geometry.right_left + geometry.label_x_offset, notes_label_y, "NOTES")
-    _apply_fine_rule_stroke(pdf, device=device, theme=theme)
+    _apply_fine_rule_stroke(pdf, strokes=strokes, theme=theme)
     pdf.line(geometry.right_left, geometry.notes_rows_top, right, geometry.notes_rows_top)
 
-    _apply_rule_stroke(pdf, device=device, theme=theme)
-    for y_pos in descending_step_positions(
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
+    y_positions = descending_step_positions(
         start=geometry.notes_rows_top,
         end=geometry.bottom,
         step=geometry.notes_step,
         include_end=True,
-    ):
-        pdf.line(
-            geometry.right_left + geometry.notes_padding,
-            y_pos,
-            right - geometry.notes_padding,
-            y_pos,
-        )
+    )
+    pdf.lines(
+        [
+            (
+                geometry.right_left + geometry.notes_padding,
+                y_pos,
+                right - geometry.notes_padding,
+                y_pos,
+            )
+            for y_pos in y_positions
+        ]
+    )
 
 
 def _draw_day_at_glance_compact_template(
@@ -620,9 +767,11 @@ def _draw_day_at_glance_compact_template(
     theme: type = Theme,
 ) -> None:
     left, bottom, right, top = content_bounds(device, layout)
+    strokes = _stroke_metrics(device)
     header_bottom = _draw_header(
         pdf,
         device=device,
+        strokes=strokes,
         left=left,
         right=right,
         top=top,
@@ -640,14 +789,14 @@ def _draw_day_at_glance_compact_template(
         header_bottom=header_bottom,
     )
 
-    _apply_border_stroke(pdf, device=device, theme=theme)
+    _apply_border_stroke(pdf, strokes=strokes, theme=theme)
     pdf.rect(left, geometry.notes_bottom, right - left, geometry.content_height, fill=0, stroke=1)
 
-    _apply_divider_stroke(pdf, device=device, theme=theme)
+    _apply_divider_stroke(pdf, strokes=strokes, theme=theme)
     pdf.line(left, geometry.priorities_bottom, right, geometry.priorities_bottom)
     pdf.line(left, geometry.schedule_bottom, right, geometry.schedule_bottom)
 
-    _apply_rule_stroke(pdf, device=device, theme=theme)
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
     pdf.line(
         geometry.label_left,
         geometry.priorities_bottom,
@@ -659,12 +808,22 @@ def _draw_day_at_glance_compact_template(
     )
     pdf.line(geometry.label_left, geometry.notes_bottom, geometry.label_left, geometry.notes_top)
 
-    def draw_vertical_section_label(
-        *,
-        section_top: float,
-        section_bottom: float,
-        label_candidates: Sequence[str],
-    ) -> None:
+    sections = (
+        (geometry.priorities_top, geometry.priorities_bottom, ("TOP PRIORITIES", "PRIORITIES")),
+        (geometry.schedule_top, geometry.schedule_bottom, ("SCHEDULE", "SCHED")),
+        (geometry.notes_top, geometry.notes_bottom, ("NOTES",)),
+    )
+    min_label_width = pt_to_device_units(40, device=device)
+    measure = _memoized_string_width(pdf)
+
+    # All section labels share one rotation: with the origin on the strip's
+    # center line and the axes turned 90 degrees, a label centered at page y
+    # is drawn at x=y in rotated coordinates.
+    pdf.save_state()
+    pdf.set_fill_color(theme.TEXT_SECONDARY)
+    pdf.translate(geometry.label_left + (geometry.label_strip_width / 2), 0)
+    pdf.rotate(90)
+    for section_top, section_bottom, label_candidates in sections:
         section_height = section_top - section_bottom
         label, label_size = _pick_fitting_label(
             pdf,
@@ -672,62 +831,41 @@ def _draw_day_at_glance_compact_template(
             font_name=theme.FONT_BOLD,
             preferred_size=geometry.section_label_pref,
             min_size=geometry.section_label_min,
-            max_width=max(
-                section_height - (2 * geometry.vertical_label_padding),
-                pt_to_device_units(40, device=device),
-            ),
+            max_width=max(section_height - (2 * geometry.vertical_label_padding), min_label_width),
+            measure=measure,
         )
-        center_x = geometry.label_left + (geometry.label_strip_width / 2)
-        center_y = section_bottom + (section_height / 2)
-        pdf.save_state()
-        pdf.set_fill_color(theme.TEXT_SECONDARY)
         pdf.set_font(theme.FONT_BOLD, label_size)
-        pdf.translate(center_x, center_y)
-        pdf.rotate(90)
-        pdf.draw_centred_string(0, -(label_size * 0.33), label)
-        pdf.restore_state()
+        pdf.draw_centred_string(section_bottom + (section_height / 2), -(label_size * 0.33), label)
+    pdf.restore_state()
 
-    draw_vertical_section_label(
-        section_top=geometry.priorities_top,
-        section_bottom=geometry.priorities_bottom,
-        label_candidates=("TOP PRIORITIES", "PRIORITIES"),
-    )
-    draw_vertical_section_label(
-        section_top=geometry.schedule_top,
-        section_bottom=geometry.schedule_bottom,
-        label_candidates=("SCHEDULE", "SCHED"),
-    )
-    draw_vertical_section_label(
-        section_top=geometry.notes_top,
-        section_bottom=geometry.notes_bottom,
-        label_candidates=("NOTES",),
+    priority_rows = stacked_row_bounds(
+        top=geometry.priorities_top,
+        row_height=geometry.priorities_row_height,
+        count=geometry.priorities_rows,
     )
-
-    for idx in range(geometry.priorities_rows):
-        row = compact_priorities_row_bounds(geometry, idx)
-
+    _apply_fine_rule_stroke(pdf, strokes=strokes, theme=theme)
+    line_start_x = geometry.checkbox_x + geometry.checkbox_size + geometry.text_gap
+    fine_segments: list[tuple[float, float, float, float]] = []
+    for idx, row in enumerate(priority_rows):
         if idx > 0:
-            _apply_fine_rule_stroke(pdf, device=device, theme=theme)
-            pdf.line(left, row.top, geometry.label_left, row.top)
-
-        box_y = row.center - (geometry.checkbox_size / 2)
-        pdf.set_stroke_color(theme.ACCENT)
-        pdf.set_line_width(mm_to_device_units(TEMPLATE_RULE_WIDTH_MM, device=device))
+            fine_segments.append((left, row.top, geometry.label_left, row.top))
+        fine_segments.append((line_start_x, row.center, geometry.writing_right, row.center))
+        fine_segments.append((left, row.bottom, geometry.label_left, row.bottom))
+    pdf.lines(fine_segments)
+
+    pdf.set_stroke_color(theme.ACCENT)
+    pdf.set_line_width(strokes.rule)
+    for row in priority_rows:
         pdf.rect(
             geometry.checkbox_x,
-            box_y,
+            row.center - (geometry.checkbox_size / 2),
             geometry.checkbox_size,
             geometry.checkbox_size,
             fill=0,
             stroke=1,
         )
 
-        _apply_fine_rule_stroke(pdf, device=device, theme=theme)
-        line_start_x = geometry.checkbox_x + geometry.checkbox_size + geometry.text_gap
-        pdf.line(line_start_x, row.center, geometry.writing_right, row.center)
-        pdf.line(left, row.bottom, geometry.label_left, row.bottom)
-
-    _apply_rule_stroke(pdf, device=device, theme=theme)
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
     pdf.line(
         left + geometry.hour_col_width,
         geometry.schedule_bottom,
@@ -735,34 +873,45 @@ def _draw_day_at_glance_compact_template(
         geometry.schedule_top,
     )
 
-    for idx, hour_value in enumerate(geometry.schedule_hours):
-        row = compact_schedule_row_bounds(geometry, idx)
+    schedule_rows = stacked_row_bounds(
+        top=geometry.schedule_top,
+        row_height=geometry.schedule_row_height,
+        count=len(geometry.schedule_hours),
+    )
+    _apply_fine_rule_stroke(pdf, strokes=strokes, theme=theme)
+    line_left = left + geometry.hour_col_width + geometry.schedule_line_left_padding
+    fine_segments = []
+    for row in schedule_rows:
+        fine_segments.append((line_left, row.center, geometry.writing_right, row.center))
+        fine_segments.append((left, row.bottom, geometry.label_left, row.bottom))
+    pdf.lines(fine_segments)
 
-        if idx > 0:
-            _apply_rule_stroke(pdf, device=device, theme=theme)
-            pdf.line(left, row.top, geometry.label_left, row.top)
-
-        pdf.set_fill_color(theme.TEXT_SECONDARY)
-        pdf.set_font(theme.FONT_BOLD, geometry.hour_font_size)
-        pdf.draw_centred_string(
-            left + (geometry.hour_col_width / 2),
-            row.center - (geometry.hour_font_size * 0.33),
-            f"{hour_value:02d}",
-        )
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
+    pdf.lines([(left, row.top, geometry.label_left, row.top) for row in schedule_rows[1:]])
 
-        _apply_fine_rule_stroke(pdf, device=device, theme=theme)
-        line_left = left + geometry.hour_col_width + geometry.schedule_line_left_padding
-        pdf.line(line_left, row.center, geometry.writing_right, row.center)
-        pdf.line(left, row.bottom, geometry.label_left, row.bottom)
+    pdf.set_fill_color(theme.TEXT_SECONDARY)
+    pdf.set_font(theme.FONT_BOLD, geometry.hour_font_size)
+    label_x = left + (geometry.hour_col_width / 2)
+    baseline_offset = geometry.hour_font_size * 0.33
+    pdf.draw_centred_strings(
+        (
+            (label_x, row.center - baseline_offset, f"{hour_value:02d}")
+            for row, hour_value in zip(schedule_rows, geometry.schedule_hours, strict=True)
+        ),
+        font_name=theme.FONT_BOLD,
+        size=geometry.hour_font_size,
+    )
 
-    _apply_rule_stroke(pdf, device=device, theme=theme)
-    for y_pos in descending_step_positions(
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
+    y_positions = descending_step_positions(
         start=geometry.notes_top,
         end=geometry.notes_bottom,
         step=geometry.notes_step,
         include_end=True,
-    ):
-        pdf.line(left + geometry.x_padding, y_pos, geometry.writing_right, y_pos)
+    )
+    pdf.lines(
+        [(left + geometry.x_padding, y_pos, geometry.writing_right, y_pos) for y_pos in y_positions]
+    )
 
 
 def _draw_checklist_template(
@@ -774,9 +923,11 @@ def _draw_checklist_template(
     theme: type = Theme,
 ) -> None:
     left, bottom, right, top = content_bounds(device, layout)
+    strokes = _stroke_metrics(device)
     header_bottom = _draw_header(
         pdf,
         device=device,
+        strokes=strokes,
         left=left,
         right=right,
         top=top,
@@ -794,7 +945,7 @@ def _draw_checklist_template(
         header_bottom=header_bottom,
     )
 
-    _apply_border_stroke(pdf, device=device, theme=theme)
+    _apply_border_stroke(pdf, strokes=strokes, theme=theme)
     pdf.rect(
         geometry.body.x,
         geometry.body.y,
@@ -810,37 +961,143 @@ def _draw_checklist_template(
         geometry.body.top,
     )
 
-    for idx in range(geometry.rows):
-        row = checklist_row_bounds(geometry, idx)
-
+    rows = stacked_row_bounds(
+        top=geometry.body.top, row_height=geometry.row_height, count=geometry.rows
+    )
+    _apply_fine_rule_stroke(pdf, strokes=strokes, theme=theme)
+    writing_left = geometry.body.x + geometry.checkbox_col_width + geometry.line_padding
+    writing_right = geometry.body.right - geometry.line_padding
+    fine_segments: list[tuple[float, float, float, float]] = []
+    for idx, row in enumerate(rows):
         if idx > 0:
-            _apply_fine_rule_stroke(pdf, device=device, theme=theme)
-            pdf.line(geometry.body.x, row.top, geometry.body.right, row.top)
-
-        box_x = geometry.body.x + ((geometry.checkbox_col_width - geometry.box_size) / 2)
+            fine_segments.append((geometry.body.x, row.top, geometry.body.right, row.top))
+        fine_segments.append((writing_left, row.center, writing_right, row.center))
+        fine_segments.append((geometry.body.x, row.bottom, geometry.body.right, row.bottom))
+    pdf.lines(fine_segments)
+
+    box_x = geometry.body.x + ((geometry.checkbox_col_width - geometry.box_size) / 2)
+    pdf.set_stroke_color(theme.ACCENT)
+    pdf.set_line_width(strokes.rule)
+    for row in rows:
         box_y = row.center - (geometry.box_size / 2)
-        pdf.set_stroke_color(theme.ACCENT)
-        pdf.set_line_width(mm_to_device_units(TEMPLATE_RULE_WIDTH_MM, device=device))
         pdf.rect(box_x, box_y, geometry.box_size, geometry.box_size, fill=0, stroke=1)
 
-        _apply_fine_rule_stroke(pdf, device=device, theme=theme)
-        pdf.line(
-            geometry.body.x + geometry.checkbox_col_width + geometry.line_padding,
-            row.center,
-            geometry.body.right - geometry.line_padding,
-            row.center,
-        )
-        pdf.line(geometry.body.x, row.bottom, geometry.body.right, row.bottom)
 
+def _fill_notes_lines(
+    pdf: DrawingPrimitives,
+    *,
+    device: DeviceProfile,
+    layout: TemplateLayoutProfile,
+    strokes: StrokeMetrics,
+    left: float,
+    bottom: float,
+    right: float,
+    top: float,
+    theme: type = Theme,
+) -> None:
+    step = mm_to_device_units(layout.line_spacing_mm, device=device)
+    line_padding = pt_to_device_units(8, device=device)
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
+    y_positions = descending_step_positions(
+        start=top,
+        end=bottom,
+        step=step,
+        include_end=True,
+    )
+    pdf.lines([(left + line_padding, y_pos, right - line_padding, y_pos) for y_pos in y_positions])
 
-def _draw_task_list_template(
+
+def _fill_notes_grid(
     pdf: DrawingPrimitives,
     *,
     device: DeviceProfile,
     layout: TemplateLayoutProfile,
+    strokes: StrokeMetrics,
+    left: float,
+    bottom: float,
+    right: float,
+    top: float,
     theme: type = Theme,
 ) -> None:
-    _draw_checklist_template(pdf, device=device, layout=layout, title="TASK LIST", theme=theme)
+    step = mm_to_device_units(layout.grid_spacing_mm, device=device)
+    _apply_fine_rule_stroke(pdf, strokes=strokes, theme=theme)
+    x_positions = ascending_step_positions(
+        start=left,
+        end=right,
+        step=step,
+    )
+    y_positions = ascending_step_positions(
+        start=bottom,
+        end=top,
+        step=step,
+    )
+    pdf.lines(
+        [(x_pos, bottom, x_pos, top) for x_pos in x_positions]
+        + [(left, y_pos, right, y_pos) for y_pos in y_positions]
+    )
+
+
+def _fill_notes_dotted_grid(
+    pdf: DrawingPrimitives,
+    *,
+    device: DeviceProfile,
+    layout: TemplateLayoutProfile,
+    strokes: StrokeMetrics,
+    left: float,
+    bottom: float,
+    right: float,
+    top: float,
+    theme: type = Theme,
+) -> None:
+    x_step = mm_to_device_units(layout.dot_spacing_mm, device=device)
+    y_step = mm_to_device_units(layout.dot_spacing_mm, device=device)
+    dot_radius = mm_to_device_units(layout.dot_radius_mm, device=device)
+    x_positions = ascending_step_positions(start=left, end=right, step=x_step)
+    y_positions = ascending_step_positions(start=bottom, end=top, step=y_step)
+    pdf.set_fill_color(theme.GRID_LINES)
+    pdf.circles(((x, y) for y in y_positions for x in x_positions), dot_radius, fill=1, stroke=0)
+
+
+def _fill_notes_millimeter(
+    pdf: DrawingPrimitives,
+    *,
+    device: DeviceProfile,
+    layout: TemplateLayoutProfile,
+    strokes: StrokeMetrics,
+    left: float,
+    bottom: float,
+    right: float,
+    top: float,
+    theme: type = Theme,
+) -> None:
+    minor_step = mm_to_device_units(1.0, device=device)
+    major_every = 5
+    x_positions = ascending_step_positions(start=left, end=right, step=minor_step)
+    y_positions = ascending_step_positions(start=bottom, end=top, step=minor_step)
+    # Every major_every-th step (1-based) is a major line.
+    major_x = x_positions[major_every - 1 :: major_every]
+    major_y = y_positions[major_every - 1 :: major_every]
+    minor_x = [x for idx, x in enumerate(x_positions, 1) if idx % major_every]
+    minor_y = [y for idx, y in enumerate(y_positions, 1) if idx % major_every]
+
+    _apply_fine_rule_stroke(pdf, strokes=strokes, theme=theme)
+    pdf.lines(
+        [(x_pos, bottom, x_pos, top) for x_pos in minor_x]
+        + [(left, y_pos, right, y_pos) for y_pos in minor_y]
+    )
+    _apply_rule_stroke(pdf, strokes=strokes, theme=theme)
+    pdf.lines(
+        [(x_pos, bottom, x_pos, top) for x_pos in major_x]
+        + [(left, y_pos, right, y_pos) for y_pos in major_y]
+    )
+
+
+_NOTES_FILLS = {
+    "lines": _fill_notes_lines,
+    "grid": _fill_notes_grid,
+    "dotted-grid": _fill_notes_dotted_grid,
+    "millimeter": _fill_notes_millimeter,
+}
 
 
 def _draw_notes_template(
@@ -851,10 +1108,18 @@ def _draw_notes_template(
     notes_fill: str = "lines",
     theme: type = Theme,
 ) -> None:
+    fill_notes = _NOTES_FILLS.get(notes_fill)
+    if fill_notes is None:
+        valid = ", ".join(NOTES_FILL_TYPES)
+        msg = f"unknown notes fill '{notes_fill}'. Valid notes fills: {valid}."
+        raise ValueError(msg)
+
     left, bottom, right, top = content_bounds(device, layout)
+    strokes = _stroke_metrics(device)
     header_bottom = _draw_header(
         pdf,
         device=device,
+        strokes=strokes,
         left=left,
         right=right,
         top=top,
@@ -864,108 +1129,19 @@ def _draw_notes_template(
     )
 
     content_height = header_bottom - bottom
-    _apply_border_stroke(pdf, device=device, theme=theme)
+    _apply_border_stroke(pdf, strokes=strokes, theme=theme)
     pdf.rect(left, bottom, right - left, content_height, fill=0, stroke=1)
-
-    if notes_fill == "lines":
-        step = mm_to_device_units(layout.line_spacing_mm, device=device)
-        line_padding = pt_to_device_units(8, device=device)
-        _apply_rule_stroke(pdf, device=device, theme=theme)
-        for y_pos in descending_step_positions(
-            start=header_bottom,
-            end=bottom,
-            step=step,
-            include_end=True,
-        ):
-            pdf.line(left + line_padding, y_pos, right - line_padding, y_pos)
-        return
-
-    if notes_fill == "grid":
-        step = mm_to_device_units(layout.grid_spacing_mm, device=device)
-        _apply_fine_rule_stroke(pdf, device=device, theme=theme)
-        for x_pos in ascending_step_positions(
-            start=left,
-            end=right,
-            step=step,
-        ):
-            pdf.line(x_pos, bottom, x_pos, header_bottom)
-        for y_pos in ascending_step_positions(
-            start=bottom,
-            end=header_bottom,
-            step=step,
-        ):
-            pdf.line(left, y_pos, right, y_pos)
-        return
-
-    if notes_fill == "dotted-grid":
-        x_step = mm_to_device_units(layout.dot_spacing_mm, device=device)
-        y_step = mm_to_device_units(layout.dot_spacing_mm, device=device)
-        dot_radius = mm_to_device_units(layout.dot_radius_mm, device=device)
-        pdf.set_fill_color(theme.GRID_LINES)
-        for y_pos in ascending_step_positions(
-            start=bottom,
-            end=header_bottom,
-            step=y_step,
-        ):
-            for x_pos in ascending_step_positions(
-                start=left,
-                end=right,
-                step=x_step,
-            ):
-                pdf.circle(x_pos, y_pos, dot_radius, fill=1, stroke=0)
-        return
-
-    if notes_fill == "millimeter":
-        minor_step = mm_to_device_units(1.0, device=device)
-        major_every = 5
-
-        _apply_fine_rule_stroke(pdf, device=device, theme=theme)
-        x_pos = left + minor_step
-        x_idx = 1
-        while x_pos < right:
-            if x_idx % major_every != 0:
-                pdf.line(x_pos, bottom, x_pos, header_bottom)
-            x_pos += minor_step
-            x_idx += 1
-
-        y_pos = bottom + minor_step
-        y_idx = 1
-        while y_pos < header_bottom:
-            if y_idx % major_every != 0:
-                pdf.line(left, y_pos, right, y_pos)
-            y_pos += minor_step
-            y_idx += 1
-
-        _apply_rule_stroke(pdf, device=device, theme=theme)
-        x_pos = left + minor_step
-        x_idx = 1
-        while x_pos < right:
-            if x_idx % major_every == 0:
-                pdf.line(x_pos, bottom, x_pos, header_bottom)
-            x_pos += minor_step
-            x_idx += 1
-
-        y_pos = bottom + minor_step
-        y_idx = 1
-        while y_pos < header_bottom:
-            if y_idx % major_every == 0:
-                pdf.line(left, y_pos, right, y_pos)
-            y_pos += minor_step
-            y_idx += 1
-        return
-
-    msg = f"unknown notes fill '{notes_fill}'. Valid notes fills: {', '.join(NOTES_FILL_TYPES)}."
-    raise ValueError(msg)
-
-
-def _draw_todo_list_template(
-    pdf: DrawingPrimitives,
-    *,
-    device: DeviceProfile,
-    layout: TemplateLayoutProfile,
-    theme: type = Theme,
-) -> None:
-    _draw_checklist_template(pdf, device=device, layout=layout, title="TO DO LIST", theme=theme)
+    fill_notes(
+        pdf,
+        device=device,
+        layout=layout,
+        strokes=strokes,
+        left=left,
+        bottom=bottom,
+        right=right,
+        top=header_bottom,
+        theme=theme,
+    )
 
 
 TEMPLATE_RENDERERS = {
@@ -974,7 +1150,7 @@ TEMPLATE_RENDERERS = {
     "dotted-grid": _draw_dotted_grid_template,
     "day-at-glance": _draw_day_at_glance_template,
     "schedule": _draw_schedule_template,
-    "task-list": _draw_task_list_template,
+    "task-list": partial(_draw_checklist_template, title="TASK LIST"),
     "notes": _draw_notes_template,
-    "todo-list": _draw_todo_list_template,
+    "todo-list": partial(_draw_checklist_template, title="TO DO LIST"),
 }
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from functools import cache
 
 from .template_blocks import CallbackBlock
 from .template_engine import (
@@ -104,11 +105,11 @@ _COMMON_PARAM_SPECS = (
 def _build_standard_template_spec(template_id: str, title: str, description: str) -> TemplateSpec:
     def build(params: dict[str, object]) -> CallbackBlock:
         _ = params
+        renderer = TEMPLATE_RENDERERS[template_id]
 
         def render_standard(ctx: RenderContext, rect: Rect) -> None:
             _ = rect
             draw_page_background(ctx.pdf, ctx.device_profile, theme=ctx.theme)
-            renderer = TEMPLATE_RENDERERS[template_id]
             renderer(
                 ctx.pdf,
                 device=ctx.device_profile,
@@ -130,11 +131,11 @@ def _build_standard_template_spec(template_id: str, title: str, description: str
 def _build_notes_template_spec() -> TemplateSpec:
     def build(params: dict[str, object]) -> CallbackBlock:
         notes_fill = str(params.get("notes_fill", "lines"))
+        notes_renderer = TEMPLATE_RENDERERS["notes"]
 
         def render_notes(ctx: RenderContext, rect: Rect) -> None:
             _ = rect
             draw_page_background(ctx.pdf, ctx.device_profile, theme=ctx.theme)
-            notes_renderer = TEMPLATE_RENDERERS["notes"]
             notes_renderer(
                 ctx.pdf,
                 device=ctx.device_profile,
@@ -154,6 +155,7 @@ def _build_notes_template_spec() -> TemplateSpec:
     )
 
 
+@cache
 def _builtin_template_specs() -> tuple[TemplateSpec, ...]:
     specs: list[TemplateSpec] = []
     for template_id, title, description in BUILTIN_TEMPLATE_METADATA:
@@ -164,21 +166,41 @@ def _builtin_template_specs() -> tuple[TemplateSpec, ...]:
     return tuple(specs)
 
 
+# Specs of registries that loaded every plugin cleanly, keyed by plugin module paths.
+_TEMPLATE_REGISTRY_SPECS: dict[tuple[str, ...], tuple[TemplateSpec, ...]] = {}
+_TEMPLATE_REGISTRY_SPECS_MAX_SIZE = 8
+
+
 def build_template_registry(
     *,
     plugin_modules: Sequence[str] = (),
 ) -> tuple[TemplateRegistry, tuple[str, ...]]:
-    """Return a registry with built-ins and optional plugin templates."""
+    """Return a new registry with built-ins and optional plugin templates.
+
+    The specs of loads without warnings are cached per plugin module tuple, so
+    repeat calls skip plugin imports; each call still gets its own registry.
+    Loads with warnings are retried on the next call.
+    """
+    key = tuple(plugin_modules)
     registry = TemplateRegistry()
+    cached_specs = _TEMPLATE_REGISTRY_SPECS.get(key)
+    if cached_specs is not None:
+        registry.register_many(cached_specs)
+        return registry, ()
+
     registry.register_many(_builtin_template_specs())
-    warnings = load_template_plugins(registry=registry, module_paths=plugin_modules)
+    warnings = load_template_plugins(registry=registry, module_paths=key)
+    if not warnings:
+        if len(_TEMPLATE_REGISTRY_SPECS) >= _TEMPLATE_REGISTRY_SPECS_MAX_SIZE:
+            _TEMPLATE_REGISTRY_SPECS.clear()
+        _TEMPLATE_REGISTRY_SPECS[key] = registry.list_specs()
     return registry, warnings
 
 
 def available_template_types(*, plugin_modules: Sequence[str] = ()) -> tuple[str, ...]:
     """Return template ids currently available to the generator."""
     registry, _ = build_template_registry(plugin_modules=plugin_modules)
-    return tuple(spec.template_id for spec in registry.list_specs())
+    return registry.template_ids()
 
 
 def list_template_specs(*, plugin_modules: Sequence[str] = ()) -> tuple[TemplateSpec, ...]:
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import pickle
 import sys
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 from .config import DEFAULT_TEMPLATE_FILENAME_TEMPLATE, Theme
 from .drawing import create_reportlab_primitives
 from .profiles import DEFAULT_DEVICE, DEVICE_PROFILES
 from .rendering import render_page_block
-from .template_engine import resolve_template_params
+from .template_engine import TemplateRegistry, resolve_template_params
 from .template_layout import (
     TEMPLATE_LAYOUT_PROFILES,
     TemplateLayoutProfile,
@@ -27,6 +30,7 @@ from .template_specs import (
     get_template_spec,
     list_template_specs,
 )
+from .theme_profiles import ThemeProfile
 
 SCHEDULE_TEMPLATE_DEFAULT_START_HOUR = 6
 SCHEDULE_TEMPLATE_DEFAULT_END_HOUR = 22
@@ -45,6 +49,13 @@ _LAYOUT_OVERRIDE_KEYS = (
 )
 
 
+def _build_registry_with_warnings(plugin_modules: Sequence[str]) -> TemplateRegistry:
+    registry, warnings = build_template_registry(plugin_modules=plugin_modules)
+    for warning in warnings:
+        print(warning, file=sys.stderr)
+    return registry
+
+
 def generate_template(
     template: str,
     output_path: str | Path | None = None,
@@ -54,20 +65,26 @@ def generate_template(
     param_overrides: Mapping[str, object] | None = None,
     plugin_modules: Sequence[str] = (),
     theme: type = Theme,
+    registry: TemplateRegistry | None = None,
 ) -> Path:
-    """Generate a single-page template PDF and return the output path."""
+    """Generate a single-page template PDF and return the output path.
+
+    Pass a prebuilt ``registry`` to skip registry construction; plugin_modules
+    is ignored in that case.
+    """
     if device not in DEVICE_PROFILES:
         msg = f"unknown device '{device}'. Valid devices: {', '.join(sorted(DEVICE_PROFILES))}."
         raise ValueError(msg)
 
-    registry, warnings = build_template_registry(plugin_modules=plugin_modules)
-    for warning in warnings:
-        print(warning, file=sys.stderr)
+    if registry is None:
+        registry = _build_registry_with_warnings(plugin_modules)
 
     template_spec = registry.get(template)
-    resolved_params = resolve_template_params(
-        spec=template_spec,
-        raw_params=param_overrides,
+    resolved_params = dict(
+        resolve_template_params(
+            spec=template_spec,
+            raw_params=param_overrides,
+        )
     )
 
     effective_schedule_start = resolved_params.get("schedule_start_hour")
@@ -80,20 +97,10 @@ def generate_template(
     resolved_params["schedule_start_hour"] = effective_schedule_start
     resolved_params["schedule_end_hour"] = effective_schedule_end
 
-    layout_overrides = {key: resolved_params.get(key) for key in _LAYOUT_OVERRIDE_KEYS}
     template_layout = resolve_template_layout(
         device=device,
         layout=layout,
-        margin_mm=layout_overrides["margin_mm"],
-        header_height_mm=layout_overrides["header_height_mm"],
-        line_spacing_mm=layout_overrides["line_spacing_mm"],
-        grid_spacing_mm=layout_overrides["grid_spacing_mm"],
-        dot_spacing_mm=layout_overrides["dot_spacing_mm"],
-        dot_radius_mm=layout_overrides["dot_radius_mm"],
-        checklist_rows=layout_overrides["checklist_rows"],
-        priorities_rows=layout_overrides["priorities_rows"],
-        schedule_start_hour=layout_overrides["schedule_start_hour"],
-        schedule_end_hour=layout_overrides["schedule_end_hour"],
+        **{key: resolved_params.get(key) for key in _LAYOUT_OVERRIDE_KEYS},
     )
 
     device_profile = DEVICE_PROFILES[device]
@@ -124,6 +131,155 @@ def generate_template(
     return destination
 
 
+def generate_templates(
+    requests: Sequence[tuple[str, str | Path | None, Mapping[str, object] | None]],
+    *,
+    device: str = DEFAULT_DEVICE,
+    layout: str | None = None,
+    plugin_modules: Sequence[str] = (),
+    theme: type | ThemeProfile = Theme,
+    workers: int | None = None,
+) -> tuple[Path, ...]:
+    """Generate one PDF per (template, output_path, param_overrides) request.
+
+    The template registry is built (and plugin warnings reported) once for the
+    whole batch, and unknown templates are rejected before anything renders.
+    With ``workers`` > 1, requests are rendered in that many worker processes;
+    each worker builds its own registry and theme once at startup, and fails
+    if it cannot load every template the batch's registry has. Worker themes
+    must be a ``ThemeProfile`` or an importable theme class.
+    """
+    registry = _build_registry_with_warnings(plugin_modules)
+    for template, _, _ in requests:
+        registry.resolve_id(template)
+    if workers is not None and workers > 1 and len(requests) > 1:
+        return _generate_templates_in_processes(
+            requests,
+            device=device,
+            layout=layout,
+            plugin_modules=tuple(plugin_modules),
+            template_ids=registry.template_ids(),
+            theme=_worker_theme(theme),
+            workers=workers,
+        )
+    theme_class = theme.to_theme_class() if isinstance(theme, ThemeProfile) else theme
+    return tuple(
+        generate_template(
+            template,
+            output_path,
+            device=device,
+            layout=layout,
+            param_overrides=param_overrides,
+            theme=theme_class,
+            registry=registry,
+        )
+        for template, output_path, param_overrides in requests
+    )
+
+
+def _worker_theme(theme: type | ThemeProfile) -> type | ThemeProfile:
+    if isinstance(theme, ThemeProfile):
+        return theme
+    # Classes are pickled by reference, so only importable ones reach a worker intact.
+    try:
+        pickle.dumps(theme)
+    except (pickle.PicklingError, AttributeError, TypeError) as exc:
+        msg = (
+            f"theme class '{theme.__qualname__}' cannot be sent to worker processes; "
+            "pass its ThemeProfile instead."
+        )
+        raise ValueError(msg) from exc
+    return theme
+
+
+def _generate_templates_in_processes(
+    requests: Sequence[tuple[str, str | Path | None, Mapping[str, object] | None]],
+    *,
+    device: str,
+    layout: str | None,
+    plugin_modules: tuple[str, ...],
+    template_ids: tuple[str, ...],
+    theme: type | ThemeProfile,
+    workers: int,
+) -> tuple[Path, ...]:
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(requests)),
+        initializer=_init_template_worker,
+        initargs=(plugin_modules, template_ids, theme),
+    ) as pool:
+        futures = [
+            pool.submit(
+                _generate_template_in_worker,
+                template,
+                output_path,
+                param_overrides,
+                device=device,
+                layout=layout,
+            )
+            for template, output_path, param_overrides in requests
+        ]
+        return tuple(future.result() for future in futures)
+
+
+@dataclass(frozen=True, slots=True)
+class _WorkerContext:
+    registry: TemplateRegistry
+    theme: type
+    # Set when the worker's registry differs from the parent's; raised per request.
+    error: str | None = None
+
+
+# Set once per worker process by _init_template_worker.
+_WORKER_CONTEXT: _WorkerContext | None = None
+
+
+def _init_template_worker(
+    plugin_modules: tuple[str, ...],
+    template_ids: tuple[str, ...],
+    theme: type | ThemeProfile,
+) -> None:
+    global _WORKER_CONTEXT
+    # Exceptions raised here would only break the pool, so a mismatch is recorded
+    # and raised from each request instead.
+    registry, warnings = build_template_registry(plugin_modules=plugin_modules)
+    error = None
+    if set(registry.template_ids()) != set(template_ids):
+        missing = ", ".join(sorted(set(template_ids) - set(registry.template_ids()))) or "none"
+        details = "".join(f"\n{warning}" for warning in warnings)
+        error = (
+            "worker process loaded different templates than the parent process "
+            f"(missing: {missing}).{details}"
+        )
+    theme_class = theme.to_theme_class() if isinstance(theme, ThemeProfile) else theme
+    _WORKER_CONTEXT = _WorkerContext(registry=registry, theme=theme_class, error=error)
+
+
+def _generate_template_in_worker(
+    template: str,
+    output_path: str | Path | None,
+    param_overrides: Mapping[str, object] | None,
+    *,
+    device: str,
+    layout: str | None,
+) -> Path:
+    context = _WORKER_CONTEXT
+    if context is None:
+        msg = "template worker was started without _init_template_worker."
+        raise RuntimeError(msg)
+    if context.error is not None:
+        msg = context.error
+        raise ValueError(msg)
+    return generate_template(
+        template,
+        output_path,
+        device=device,
+        layout=layout,
+        param_overrides=param_overrides,
+        theme=context.theme,
+        registry=context.registry,
+    )
+
+
 __all__ = [
     "TEMPLATE_LAYOUT_PROFILES",
     "TEMPLATE_TYPES",
@@ -134,6 +290,7 @@ __all__ = [
     "build_template_registry",
     "font_pt_to_device_units",
     "generate_template",
+    "generate_templates",
     "get_template_spec",
     "list_template_specs",
     "mm_to_device_units",
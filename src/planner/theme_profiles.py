@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from reportlab.lib import colors
@@ -28,25 +31,43 @@ class ThemeProfile:
     font_bold: str = "Helvetica-Bold"
 
     def to_theme_class(self) -> type:
-        """Return a runtime Theme-like class with parsed color objects."""
-        return type(
-            "Theme",
-            (),
-            {
-                "BACKGROUND": _parse_color(self.background, key="background"),
-                "SIDEBAR_BG": _parse_color(self.sidebar_bg, key="sidebar_bg"),
-                "SIDEBAR_TEXT": _parse_color(self.sidebar_text, key="sidebar_text"),
-                "TEXT_PRIMARY": _parse_color(self.text_primary, key="text_primary"),
-                "TEXT_SECONDARY": _parse_color(self.text_secondary, key="text_secondary"),
-                "ACCENT": _parse_color(self.accent, key="accent"),
-                "GRID_LINES": _parse_color(self.grid_lines, key="grid_lines"),
-                "WRITING_LINES": _parse_color(self.writing_lines, key="writing_lines"),
-                "LINK_BADGE_BG": _parse_color(self.link_badge_bg, key="link_badge_bg"),
-                "FONT_HEADER": _parse_font(self.font_header, key="font_header"),
-                "FONT_REGULAR": _parse_font(self.font_regular, key="font_regular"),
-                "FONT_BOLD": _parse_font(self.font_bold, key="font_bold"),
-            },
-        )
+        """Return a runtime Theme-like class with parsed color objects.
+
+        Parsed values are cached per profile value. Each call returns a fresh
+        subclass of the cached class, so attributes set on it do not leak into
+        themes resolved later.
+        """
+        try:
+            base = _cached_theme_class(self)
+        except TypeError:  # unhashable field values, e.g. a list from a theme file
+            return _build_theme_class(self)
+        return type("Theme", (base,), {})
+
+
+def _build_theme_class(profile: ThemeProfile) -> type:
+    return type(
+        "Theme",
+        (),
+        {
+            "BACKGROUND": _parse_color(profile.background, key="background"),
+            "SIDEBAR_BG": _parse_color(profile.sidebar_bg, key="sidebar_bg"),
+            "SIDEBAR_TEXT": _parse_color(profile.sidebar_text, key="sidebar_text"),
+            "TEXT_PRIMARY": _parse_color(profile.text_primary, key="text_primary"),
+            "TEXT_SECONDARY": _parse_color(profile.text_secondary, key="text_secondary"),
+            "ACCENT": _parse_color(profile.accent, key="accent"),
+            "GRID_LINES": _parse_color(profile.grid_lines, key="grid_lines"),
+            "WRITING_LINES": _parse_color(profile.writing_lines, key="writing_lines"),
+            "LINK_BADGE_BG": _parse_color(profile.link_badge_bg, key="link_badge_bg"),
+            "FONT_HEADER": _parse_font(profile.font_header, key="font_header"),
+            "FONT_REGULAR": _parse_font(profile.font_regular, key="font_regular"),
+            "FONT_BOLD": _parse_font(profile.font_bold, key="font_bold"),
+        },
+    )
+
+
+@lru_cache(maxsize=32)
+def _cached_theme_class(profile: ThemeProfile) -> type:
+    return _build_theme_class(profile)
 
 
 _BUILTIN_THEME_PROFILES: dict[str, ThemeProfile] = {
@@ -76,11 +97,19 @@ def resolve_theme(
     return resolved_profile.to_theme_class()
 
 
-def _load_theme_file(path: Path) -> dict[str, Any]:
-    if not path.exists():
+def _load_theme_file(path: Path) -> Mapping[str, Any]:
+    try:
+        stat = path.stat()
+    except OSError as exc:
         msg = f"theme file '{path}' does not exist."
-        raise ValueError(msg)
+        raise ValueError(msg) from exc
+    # Keyed by mtime and size so an edited file is re-read on the next call.
+    return _load_theme_file_cached(path, stat.st_mtime_ns, stat.st_size)
+
 
+@lru_cache(maxsize=16)
+def _load_theme_file_cached(path: Path, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    _ = (mtime_ns, size)
     try:
         payload = json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as exc:
@@ -97,7 +126,7 @@ def _load_theme_file(path: Path) -> dict[str, Any]:
         msg = f"unknown theme key(s): {', '.join(unknown)}."
         raise ValueError(msg)
 
-    return payload
+    return MappingProxyType(payload)
 
 
 def _parse_color(raw_value: str, *, key: str) -> colors.Color:
@@ -0,0 +1,24 @@
+"""Shared scaffolding for tests that write files."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class TempRootTestCase(unittest.TestCase):
+    """Test case with one temporary root per class and a fresh directory per test."""
+
+    tmp_root: Path
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.tmp_root = Path(tmp.name)
+
+    def make_test_dir(self) -> Path:
+        """Return a new empty directory under the class temporary root."""
+        return Path(tempfile.mkdtemp(dir=self.tmp_root))
@@ -0,0 +1,43 @@
+"""Tests for identity-keyed memoization."""
+
+from __future__ import annotations
+
+import unittest
+
+from planner.caching import IDENTITY_MEMO_MAX_SIZE, identity_memo
+
+
+class _Owner:
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Owner)
+
+    def __hash__(self) -> int:
+        return 0
+
+
+class IdentityMemoTests(unittest.TestCase):
+    def test_results_are_shared_per_owner_identity_and_arguments(self) -> None:
+        calls: list[tuple[_Owner, int]] = []
+
+        @identity_memo
+        def build(owner: _Owner, *, size: int) -> object:
+            calls.append((owner, size))
+            return object()
+
+        first_owner, equal_owner = _Owner(), _Owner()
+        first = build(first_owner, size=1)
+        self.assertIs(build(first_owner, size=1), first)
+        self.assertIsNot(build(first_owner, size=2), first)
+        self.assertIsNot(build(equal_owner, size=1), first)
+        self.assertEqual(len(calls), 3)
+
+    def test_memo_is_cleared_when_full(self) -> None:
+        @identity_memo
+        def build(owner: _Owner) -> object:
+            return object()
+
+        first_owner = _Owner()
+        first = build(first_owner)
+        for _ in range(IDENTITY_MEMO_MAX_SIZE):
+            build(_Owner())
+        self.assertIsNot(build(first_owner), first)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import unittest
+from dataclasses import replace
 
 from planner.planner_geometry import (
     ascending_step_positions,
@@ -54,12 +55,32 @@ class MonthGeometryTests(unittest.TestCase):
         self.assertAlmostEqual(badge.top, cell.top)
         self.assertAlmostEqual(center.x, geometry.start_x + (2.5 * geometry.col_width))
 
+    def test_month_derived_geometry_follows_replaced_fields(self) -> None:
+        geometry = replace(
+            compute_month_grid_geometry(DEFAULT_RENDER_PROFILE),
+            start_x=10.0,
+            weekday_label_y_offset=5.0,
+        )
+        cell = month_cell_rect(geometry, row_idx=0, col_idx=1)
+        center = month_weekday_label_center(geometry, col_idx=0)
+
+        self.assertAlmostEqual(cell.x, 10.0 + geometry.col_width)
+        self.assertAlmostEqual(center.x, 10.0 + (geometry.col_width / 2))
+        self.assertAlmostEqual(center.y, geometry.start_y + 5.0)
+
 
 class WeekGeometryTests(unittest.TestCase):
     def test_week_geometry_rejects_invalid_column_count(self) -> None:
         with self.assertRaises(ValueError):
             compute_week_grid_geometry(DEFAULT_RENDER_PROFILE, column_count=0)
 
+    def test_week_geometry_is_reused_per_profile_and_column_count(self) -> None:
+        geometry = compute_week_grid_geometry(DEFAULT_RENDER_PROFILE, column_count=7)
+        self.assertIs(compute_week_grid_geometry(DEFAULT_RENDER_PROFILE, column_count=7), geometry)
+        self.assertIsNot(
+            compute_week_grid_geometry(DEFAULT_RENDER_PROFILE, column_count=4), geometry
+        )
+
     def test_week_writing_lines_stay_within_column(self) -> None:
         geometry = compute_week_grid_geometry(DEFAULT_RENDER_PROFILE, column_count=7)
         column = week_column_rect(geometry, col_idx=0)
@@ -95,6 +116,18 @@ class DailyGeometryTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             daily_priorities_row_bounds(geometry, geometry.checklist_items)
 
+    def test_daily_rows_follow_replaced_fields(self) -> None:
+        geometry = replace(
+            compute_daily_view_geometry(DEFAULT_RENDER_PROFILE),
+            top_y=500.0,
+            schedule_hour_height=20.0,
+        )
+        row = daily_schedule_row_bounds(geometry, 2)
+
+        self.assertEqual(len(geometry.schedule_rows), geometry.schedule_hour_count)
+        self.assertAlmostEqual(row.top, 460.0)
+        self.assertAlmostEqual(row.bottom, 440.0)
+
 
 class GeometryStepTests(unittest.TestCase):
     def test_ascending_step_positions_rejects_non_positive_step(self) -> None:
@@ -106,3 +139,8 @@ class GeometryStepTests(unittest.TestCase):
             ascending_step_positions(start=0, end=10, step=3),
             (3, 6, 9),
         )
+
+    def test_ascending_step_positions_do_not_drift_onto_end(self) -> None:
+        positions = ascending_step_positions(start=0, end=1, step=0.1)
+        self.assertEqual(len(positions), 9)
+        self.assertAlmostEqual(positions[-1], 0.9)
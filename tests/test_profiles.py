@@ -36,6 +36,13 @@ class RenderProfileTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             resolve_render_profile(layout="not-a-layout")
 
+    def test_resolved_profiles_are_shared_between_calls(self) -> None:
+        profile = resolve_render_profile(device="scribe", layout="balanced")
+        self.assertIs(resolve_render_profile(device="scribe", layout="balanced"), profile)
+        self.assertIs(
+            resolve_fitted_render_profile(device="scribe", layout="balanced").profile, profile
+        )
+
     def test_fit_evaluation_flags_small_device_full_layout(self) -> None:
         issues = evaluate_render_profile_fit(resolve_render_profile(device="palma", layout="full"))
         self.assertTrue(any("weekly column width" in issue for issue in issues))
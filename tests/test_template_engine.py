@@ -95,12 +95,76 @@ class TemplateRegistryTests(unittest.TestCase):
                 )
             )
 
+    def test_registry_rejects_duplicate_param_keys_at_registration(self) -> None:
+        registry = TemplateRegistry()
+        with self.assertRaisesRegex(ValueError, "duplicate parameter key mapping 'rows'"):
+            registry.register(
+                TemplateSpec(
+                    template_id="example",
+                    title="Example",
+                    description="Example template.",
+                    build=_dummy_build,
+                    params=(
+                        TemplateParamSpec(key="rows", value_type=int, description="Rows."),
+                        TemplateParamSpec(
+                            key="lines", value_type=int, description="Lines.", aliases=("rows",)
+                        ),
+                    ),
+                )
+            )
+        self.assertEqual(registry.template_ids(), ())
+
+    def test_registry_rejects_unsupported_param_type_at_registration(self) -> None:
+        registry = TemplateRegistry()
+        with self.assertRaisesRegex(ValueError, "unsupported param type"):
+            registry.register(
+                TemplateSpec(
+                    template_id="example",
+                    title="Example",
+                    description="Example template.",
+                    build=_dummy_build,
+                    params=(TemplateParamSpec(key="rows", value_type=list, description="Rows."),),
+                )
+            )
+        self.assertEqual(registry.template_ids(), ())
+
+    def test_registry_register_many_is_all_or_nothing(self) -> None:
+        registry = TemplateRegistry()
+        with self.assertRaises(ValueError):
+            registry.register_many(
+                [
+                    TemplateSpec(
+                        template_id="one",
+                        title="One",
+                        description="One template.",
+                        build=_dummy_build,
+                        aliases=("first",),
+                    ),
+                    TemplateSpec(
+                        template_id="two",
+                        title="Two",
+                        description="Two template.",
+                        build=_dummy_build,
+                        aliases=("first",),
+                    ),
+                ]
+            )
+        self.assertEqual(registry.template_ids(), ())
+        with self.assertRaises(ValueError):
+            registry.get("first")
+
 
 class ParameterParsingTests(unittest.TestCase):
     def test_parse_param_pairs_rejects_missing_separator(self) -> None:
         with self.assertRaises(ValueError):
             parse_param_pairs(["notes_fill"])
 
+    def test_parse_param_pairs_splits_on_first_separator(self) -> None:
+        self.assertEqual(
+            parse_param_pairs([" title = a=b ", "notes_fill=grid"]),
+            {"title": "a=b", "notes_fill": "grid"},
+        )
+
     def test_resolve_template_params_applies_defaults_and_raw_params(self) -> None:
         spec = TemplateSpec(
             template_id="notes",
@@ -134,6 +198,53 @@ class ParameterParsingTests(unittest.TestCase):
         self.assertEqual(resolved["notes_fill"], "grid")
         self.assertEqual(resolved["checklist_rows"], 4)
 
+    def test_resolve_template_params_returns_shared_read_only_mapping(self) -> None:
+        spec = TemplateSpec(
+            template_id="notes",
+            title="Notes",
+            description="Notes template.",
+            build=_dummy_build,
+            params=(
+                TemplateParamSpec(
+                    key="label",
+                    value_type=str,
+                    description="Label.",
+                    default="none",
+                ),
+            ),
+        )
+
+        first = resolve_template_params(spec=spec, raw_params={"label": 1})
+        second = resolve_template_params(spec=spec, raw_params={"label": 1})
+        self.assertIs(first, second)
+        with self.assertRaises(TypeError):
+            first["label"] = "other"  # type: ignore[index]
+        self.assertEqual(
+            resolve_template_params(spec=spec, raw_params={"label": 1.0})["label"], "1.0"
+        )
+
+    def test_resolve_template_params_coerces_typed_and_string_numbers(self) -> None:
+        spec = TemplateSpec(
+            template_id="numbers",
+            title="Numbers",
+            description="Numbers template.",
+            build=_dummy_build,
+            params=(
+                TemplateParamSpec(key="rows", value_type=int, description="Rows."),
+                TemplateParamSpec(key="spacing", value_type=float, description="Spacing."),
+            ),
+        )
+
+        resolved = resolve_template_params(spec=spec, raw_params={"rows": 3, "spacing": 2})
+        self.assertEqual(resolved["rows"], 3)
+        self.assertIsInstance(resolved["spacing"], float)
+        self.assertEqual(
+            resolve_template_params(spec=spec, raw_params={"rows": " 5 "})["rows"],
+            5,
+        )
+        with self.assertRaisesRegex(ValueError, "Expected an integer"):
+            resolve_template_params(spec=spec, raw_params={"rows": "5x"})
+
     def test_resolve_template_params_rejects_unknown_param(self) -> None:
         spec = TemplateSpec(
             template_id="simple",
@@ -18,6 +18,7 @@ from planner.template_geometry import (
     day_at_glance_schedule_row_bounds,
     descending_step_positions,
     schedule_row_bounds,
+    stacked_row_bounds,
 )
 from planner.template_layout import (
     content_bounds,
@@ -34,6 +35,14 @@ class StepPositionTests(unittest.TestCase):
             (0, 5, 10),
         )
 
+    def test_step_positions_do_not_accumulate_rounding_error(self) -> None:
+        ascending = ascending_step_positions(start=0, end=100, step=0.1, include_end=True)
+        descending = descending_step_positions(start=100, end=0, step=0.1, include_end=True)
+        self.assertEqual(len(ascending), 1000)
+        self.assertEqual(ascending[-1], 100.0)
+        self.assertEqual(len(descending), 1000)
+        self.assertEqual(descending[-1], 0.0)
+
     def test_descending_positions_reject_non_positive_step(self) -> None:
         with self.assertRaises(ValueError):
             descending_step_positions(start=10, end=0, step=0)
@@ -175,3 +184,28 @@ class ChecklistGeometryTests(unittest.TestCase):
             checklist_row_bounds(geometry, -1)
         with self.assertRaises(ValueError):
             checklist_row_bounds(geometry, geometry.rows)
+
+    def test_stacked_row_bounds_match_per_index_bounds(self) -> None:
+        device = DEVICE_PROFILES["remarkable"]
+        layout = resolve_template_layout(device="remarkable", layout="balanced")
+        left, bottom, right, top = content_bounds(device, layout)
+        geometry = compute_checklist_geometry(
+            device=device,
+            layout=layout,
+            left=left,
+            bottom=bottom,
+            right=right,
+            header_bottom=top,
+        )
+
+        self.assertEqual(
+            stacked_row_bounds(
+                top=geometry.body.top, row_height=geometry.row_height, count=geometry.rows
+            ),
+            tuple(checklist_row_bounds(geometry, idx) for idx in range(geometry.rows)),
+        )
+
+    def test_stacked_row_bounds_are_shared_for_repeated_rows(self) -> None:
+        first = stacked_row_bounds(top=500.0, row_height=20.0, count=16)
+        self.assertIs(stacked_row_bounds(top=500.0, row_height=20.0, count=16), first)
+        self.assertEqual(first[-1].bottom, 180.0)
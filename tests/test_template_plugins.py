@@ -3,21 +3,12 @@
 from __future__ import annotations
 
 import sys
-import tempfile
-import unittest
-from pathlib import Path
 
 from planner.template_engine import TemplateRegistry
 from planner.template_engine.plugins import load_template_plugins
+from support import TempRootTestCase
 
-
-class TemplatePluginLoadingTests(unittest.TestCase):
-    def test_load_template_plugin_module(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            plugin_dir = Path(tmp_dir)
-            plugin_file = plugin_dir / "demo_plugin.py"
-            plugin_file.write_text(
-                """
+DEMO_PLUGIN_SOURCE = """
 from planner.template_engine import TemplateSpec
 
 class _Block:
@@ -37,30 +28,62 @@ def register_templates(registry):
         )
     )
 """
-            )
-
-            sys.path.insert(0, str(plugin_dir))
-            try:
-                registry = TemplateRegistry()
-                warnings = load_template_plugins(registry=registry, module_paths=("demo_plugin",))
-                self.assertEqual(warnings, ())
-                self.assertEqual(registry.get("plugin-demo").template_id, "plugin-demo")
-            finally:
-                sys.path.remove(str(plugin_dir))
-                sys.modules.pop("demo_plugin", None)
+
+UNSUPPORTED_PARAM_PLUGIN_SOURCE = """
+from planner.template_engine import TemplateParamSpec, TemplateSpec
+
+def register_templates(registry):
+    registry.register(
+        TemplateSpec(
+            template_id="plugin-tags",
+            title="Plugin Tags",
+            description="Plugin template with a list-valued param.",
+            build=lambda params: None,
+            params=(TemplateParamSpec(key="tags", value_type=list, description="Tags."),),
+        )
+    )
+"""
+
+PLUGIN_MODULES = {
+    "demo_plugin": DEMO_PLUGIN_SOURCE,
+    "bad_plugin": "x = 1\n",
+    "unsupported_param_plugin": UNSUPPORTED_PARAM_PLUGIN_SOURCE,
+}
+
+
+class TemplatePluginLoadingTests(TempRootTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        for module_name, source in PLUGIN_MODULES.items():
+            (cls.tmp_root / f"{module_name}.py").write_text(source)
+        sys.path.insert(0, str(cls.tmp_root))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        sys.path.remove(str(cls.tmp_root))
+        for module_name in PLUGIN_MODULES:
+            sys.modules.pop(module_name, None)
+        super().tearDownClass()
+
+    def test_load_template_plugin_module(self) -> None:
+        registry = TemplateRegistry()
+        warnings = load_template_plugins(registry=registry, module_paths=("demo_plugin",))
+        self.assertEqual(warnings, ())
+        self.assertEqual(registry.get("plugin-demo").template_id, "plugin-demo")
 
     def test_load_template_plugin_reports_warning_for_bad_module(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            plugin_dir = Path(tmp_dir)
-            plugin_file = plugin_dir / "bad_plugin.py"
-            plugin_file.write_text("x = 1\n")
-
-            sys.path.insert(0, str(plugin_dir))
-            try:
-                registry = TemplateRegistry()
-                warnings = load_template_plugins(registry=registry, module_paths=("bad_plugin",))
-                self.assertEqual(len(warnings), 1)
-                self.assertIn("failed to load template plugin", warnings[0])
-            finally:
-                sys.path.remove(str(plugin_dir))
-                sys.modules.pop("bad_plugin", None)
+        registry = TemplateRegistry()
+        warnings = load_template_plugins(registry=registry, module_paths=("bad_plugin",))
+        self.assertEqual(len(warnings), 1)
+        self.assertIn("failed to load template plugin", warnings[0])
+
+    def test_load_template_plugin_reports_unsupported_param_type_at_registration(self) -> None:
+        registry = TemplateRegistry()
+        warnings = load_template_plugins(
+            registry=registry, module_paths=("unsupported_param_plugin",)
+        )
+        self.assertEqual(len(warnings), 1)
+        self.assertIn("failed to load template plugin 'unsupported_param_plugin'", warnings[0])
+        self.assertIn("unsupported param type", warnings[0])
+        self.assertNotIn("plugin-tags", registry.template_ids())
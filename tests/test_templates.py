@@ -3,129 +3,52 @@
 from __future__ import annotations
 
 import io
+import os
 import re
 import sys
 import tempfile
 import unittest
-from contextlib import redirect_stderr
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, redirect_stderr
+from dataclasses import replace
+from functools import cache
 from pathlib import Path
-
-from reportlab.pdfgen import canvas as reportlab_canvas
+from typing import Any
 
 import planner.templates as templates_module
+from planner.config import Theme
+from planner.drawing import ReportLabPrimitives
 from planner.profiles import DEVICE_PROFILES
+from planner.template_layout import device_unit_scales
+from planner.template_renderers import (
+    TEMPLATE_RENDERERS,
+    _fit_font_size_to_width,
+    _fit_header_labels,
+    _pick_fitting_label,
+    _title_candidates,
+    draw_page_background,
+)
 from planner.templates import (
     NOTES_FILL_TYPES,
+    TEMPLATE_LAYOUT_PROFILES,
     TEMPLATE_TYPES,
     available_template_types,
+    build_template_registry,
     font_pt_to_device_units,
     generate_template,
+    generate_templates,
     get_template_spec,
     list_template_specs,
     mm_to_device_units,
     pt_to_device_units,
     resolve_template_layout,
 )
+from planner.theme_profiles import ThemeProfile
+from support import TempRootTestCase
 
 _PDF_PAGE_PATTERN = re.compile(rb"/Type\s*/Page\b")
 
-
-class GenerateTemplateTests(unittest.TestCase):
-    def test_generate_template_writes_single_page_pdf_for_each_template(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            for template in TEMPLATE_TYPES:
-                output_path = Path(tmp_dir) / f"{template}.pdf"
-                generated_path = generate_template(template=template, output_path=output_path)
-
-                self.assertEqual(generated_path, output_path)
-                self.assertTrue(output_path.exists())
-
-                data = output_path.read_bytes()
-                self.assertTrue(data.startswith(b"%PDF"))
-                self.assertEqual(len(_PDF_PAGE_PATTERN.findall(data)), 1)
-
-    def test_generate_template_supports_device_and_layout_overrides(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_path = Path(tmp_dir) / "palma_grid.pdf"
-            generated_path = generate_template(
-                template="grid",
-                output_path=output_path,
-                device="palma",
-                layout="compact",
-                param_overrides={
-                    "margin_mm": 6.5,
-                    "header_height_mm": 6.0,
-                    "grid_spacing_mm": 3.8,
-                },
-            )
-
-            self.assertEqual(generated_path, output_path)
-            self.assertTrue(output_path.exists())
-            data = output_path.read_bytes()
-            self.assertTrue(data.startswith(b"%PDF"))
-            self.assertEqual(len(_PDF_PAGE_PATTERN.findall(data)), 1)
-
-    def test_generate_notes_template_supports_all_fill_styles(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            for notes_fill in NOTES_FILL_TYPES:
-                output_path = Path(tmp_dir) / f"notes_{notes_fill}.pdf"
-                generated_path = generate_template(
-                    template="notes",
-                    output_path=output_path,
-                    param_overrides={"notes_fill": notes_fill},
-                )
-
-                self.assertEqual(generated_path, output_path)
-                self.assertTrue(output_path.exists())
-                self.assertEqual(len(_PDF_PAGE_PATTERN.findall(output_path.read_bytes())), 1)
-
-    def test_generate_template_rejects_unknown_template_or_layout(self) -> None:
-        with self.assertRaises(ValueError):
-            generate_template(template="unknown")
-        with self.assertRaises(ValueError):
-            generate_template(template="lines", layout="unknown")
-        with self.assertRaises(ValueError):
-            generate_template(template="lines", device="unknown")
-
-    def test_generate_template_rejects_invalid_layout_parameters(self) -> None:
-        with self.assertRaises(ValueError):
-            generate_template(template="lines", param_overrides={"margin_mm": 0})
-        with self.assertRaises(ValueError):
-            generate_template(template="dotted-grid", param_overrides={"dot_radius_mm": 0})
-        with self.assertRaises(ValueError):
-            generate_template(
-                template="day-at-glance",
-                param_overrides={
-                    "schedule_start_hour": 21,
-                    "schedule_end_hour": 21,
-                },
-            )
-        with self.assertRaises(ValueError):
-            generate_template(template="task-list", param_overrides={"checklist_rows": 0})
-        with self.assertRaises(ValueError):
-            generate_template(template="todo-list", param_overrides={"checklist_rows": 0})
-        with self.assertRaises(ValueError):
-            generate_template(template="notes", param_overrides={"notes_fill": "unknown"})
-
-    def test_generate_template_supports_todo_list_alias(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            task_path = Path(tmp_dir) / "task_list.pdf"
-            todo_path = Path(tmp_dir) / "todo_list.pdf"
-            generate_template(template="task-list", output_path=task_path)
-            generate_template(template="todo-list", output_path=todo_path)
-
-            self.assertTrue(task_path.exists())
-            self.assertTrue(todo_path.exists())
-            self.assertEqual(len(_PDF_PAGE_PATTERN.findall(task_path.read_bytes())), 1)
-            self.assertEqual(len(_PDF_PAGE_PATTERN.findall(todo_path.read_bytes())), 1)
-
-    def test_generate_template_supports_local_plugin_module(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            plugin_dir = Path(tmp_dir) / "plugins"
-            plugin_dir.mkdir(parents=True)
-            plugin_file = plugin_dir / "demo_template_plugin.py"
-            plugin_file.write_text(
-                """
+DEMO_TEMPLATE_PLUGIN_SOURCE = """
 from planner.config import Theme
 from planner.template_blocks import CompositeBlock, PageBackgroundBlock
 from planner.template_engine import TemplateSpec
@@ -143,22 +66,222 @@ def register_templates(registry):
         )
     )
 """
+
+# Registers a template only in the process that wrote it, to stand in for a plugin
+# that imports in the parent but not in spawned worker processes.
+PARENT_ONLY_TEMPLATE_PLUGIN_SOURCE = """
+import os
+from planner.template_engine import TemplateSpec
+
+def register_templates(registry):
+    if os.getpid() != PARENT_PID:
+        raise ImportError("plugin is unavailable in this process")
+    registry.register(
+        TemplateSpec(
+            template_id="parent-only",
+            title="Parent Only",
+            description="Plugin template the workers cannot load.",
+            build=lambda params: None,
+        )
+    )
+"""
+
+PLUGIN_MODULES = {
+    "demo_template_plugin": DEMO_TEMPLATE_PLUGIN_SOURCE,
+    "parent_only_template_plugin": PARENT_ONLY_TEMPLATE_PLUGIN_SOURCE.replace(
+        "PARENT_PID", str(os.getpid())
+    ),
+}
+
+
+@cache
+def _generated_template_pdf(template: str, overrides: tuple[tuple[str, Any], ...] = ()) -> bytes:
+    """Render a template with default device settings once per test run and return its bytes."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = Path(tmp_dir) / "template.pdf"
+        generate_template(
+            template=template, output_path=output_path, param_overrides=dict(overrides)
+        )
+        return output_path.read_bytes()
+
+
+@contextmanager
+def _forbid_pdf_output() -> Iterator[None]:
+    """Fail if generate_template opens a PDF canvas before rejecting its request."""
+    original = templates_module.create_reportlab_primitives
+
+    def fail(*args: object, **kwargs: object) -> None:
+        msg = "template request was not rejected before creating a PDF canvas"
+        raise AssertionError(msg)
+
+    templates_module.create_reportlab_primitives = fail
+    try:
+        yield
+    finally:
+        templates_module.create_reportlab_primitives = original
+
+
+class _RendererCaptured(Exception):
+    """Raised by capturing renderers to stop generate_template before the PDF is saved."""
+
+
+class GenerateTemplateTests(TempRootTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.plugin_dir = cls.tmp_root / "plugins"
+        cls.plugin_dir.mkdir()
+        for module_name, source in PLUGIN_MODULES.items():
+            (cls.plugin_dir / f"{module_name}.py").write_text(source)
+        sys.path.insert(0, str(cls.plugin_dir))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        sys.path.remove(str(cls.plugin_dir))
+        for module_name in PLUGIN_MODULES:
+            sys.modules.pop(module_name, None)
+        super().tearDownClass()
+
+    def _assert_single_page_pdf(self, data: bytes) -> None:
+        self.assertTrue(data.startswith(b"%PDF"))
+        self.assertEqual(len(_PDF_PAGE_PATTERN.findall(data)), 1)
+
+    def test_generate_template_writes_single_page_pdf_for_each_template(self) -> None:
+        for template in TEMPLATE_TYPES:
+            self._assert_single_page_pdf(_generated_template_pdf(template))
+
+    def test_generate_templates_reports_plugin_warnings_once_per_batch(self) -> None:
+        missing_module = "_planner_missing_batch_plugin_"
+        stderr = io.StringIO()
+        tmp_dir = self.make_test_dir()
+        with redirect_stderr(stderr):
+            outputs = generate_templates(
+                (
+                    ("lines", tmp_dir / "lines.pdf", None),
+                    ("notes", tmp_dir / "notes.pdf", {"notes_fill": "grid"}),
+                ),
+                device="palma",
+                plugin_modules=(missing_module,),
+            )
+        self.assertEqual(outputs, (tmp_dir / "lines.pdf", tmp_dir / "notes.pdf"))
+        for output_path in outputs:
+            self._assert_single_page_pdf(output_path.read_bytes())
+
+        self.assertEqual(stderr.getvalue().count("warning: failed to load template plugin"), 1)
+
+    def test_generate_templates_renders_in_worker_processes_with_theme_profile(self) -> None:
+        theme = ThemeProfile(background="#FFFFFF", accent="#112233")
+        tmp_dir = self.make_test_dir()
+        requests = tuple(
+            (template, tmp_dir / f"{template}.pdf", None)
+            for template in ("lines", "schedule", "task-list")
+        )
+        outputs = generate_templates(requests, device="palma", theme=theme, workers=2)
+
+        self.assertEqual(outputs, tuple(output_path for _, output_path, _ in requests))
+        for output_path in outputs:
+            self._assert_single_page_pdf(output_path.read_bytes())
+
+    def test_generate_templates_rejects_runtime_theme_class_for_workers(self) -> None:
+        theme = ThemeProfile(accent="#112233").to_theme_class()
+        with self.assertRaisesRegex(ValueError, "pass its ThemeProfile instead"):
+            generate_templates(
+                (("lines", None, None), ("grid", None, None)), theme=theme, workers=2
             )
 
-            sys.path.insert(0, str(plugin_dir))
-            try:
-                output_path = Path(tmp_dir) / "plugin_blank.pdf"
-                generated_path = generate_template(
-                    template="plugin-blank",
-                    output_path=output_path,
-                    plugin_modules=("demo_template_plugin",),
+    def test_generate_templates_fails_when_a_worker_cannot_load_a_plugin(self) -> None:
+        tmp_dir = self.make_test_dir()
+        # The missing module keeps the parent's registry out of the spec cache, so
+        # forked workers load plugins themselves as spawned ones would.
+        plugin_modules = ("_planner_missing_worker_plugin_", "parent_only_template_plugin")
+        with redirect_stderr(io.StringIO()):
+            with self.assertRaisesRegex(ValueError, r"missing: parent-only\)"):
+                generate_templates(
+                    (
+                        ("parent-only", tmp_dir / "parent_only.pdf", None),
+                        ("lines", tmp_dir / "lines.pdf", None),
+                    ),
+                    plugin_modules=plugin_modules,
+                    workers=2,
                 )
-                self.assertEqual(generated_path, output_path)
-                self.assertTrue(output_path.exists())
-                self.assertEqual(len(_PDF_PAGE_PATTERN.findall(output_path.read_bytes())), 1)
-            finally:
-                sys.path.remove(str(plugin_dir))
-                sys.modules.pop("demo_template_plugin", None)
+
+    def test_generate_templates_rejects_unknown_template_before_starting_workers(self) -> None:
+        original_executor = templates_module.ProcessPoolExecutor
+
+        def fail(*args: object, **kwargs: object) -> None:
+            msg = "worker pool started before template ids were validated"
+            raise AssertionError(msg)
+
+        templates_module.ProcessPoolExecutor = fail  # type: ignore[assignment]
+        try:
+            with self.assertRaisesRegex(ValueError, "unknown template 'missing'"):
+                generate_templates(
+                    (("lines", None, None), ("missing", None, None)),
+                    workers=2,
+                )
+        finally:
+            templates_module.ProcessPoolExecutor = original_executor  # type: ignore[misc]
+
+    def test_generate_template_supports_device_and_layout_overrides(self) -> None:
+        tmp_dir = self.make_test_dir()
+        output_path = tmp_dir / "palma_grid.pdf"
+        generated_path = generate_template(
+            template="grid",
+            output_path=output_path,
+            device="palma",
+            layout="compact",
+            param_overrides={
+                "margin_mm": 6.5,
+                "header_height_mm": 6.0,
+                "grid_spacing_mm": 3.8,
+            },
+        )
+
+        self.assertEqual(generated_path, output_path)
+        self._assert_single_page_pdf(output_path.read_bytes())
+
+    def test_generate_notes_template_supports_all_fill_styles(self) -> None:
+        for notes_fill in NOTES_FILL_TYPES:
+            self._assert_single_page_pdf(
+                _generated_template_pdf("notes", (("notes_fill", notes_fill),))
+            )
+
+    def test_generate_template_rejects_unknown_template_or_layout(self) -> None:
+        with _forbid_pdf_output():
+            with self.assertRaises(ValueError):
+                generate_template(template="unknown")
+            with self.assertRaises(ValueError):
+                generate_template(template="lines", layout="unknown")
+            with self.assertRaises(ValueError):
+                generate_template(template="lines", device="unknown")
+
+    def test_generate_template_rejects_invalid_layout_parameters(self) -> None:
+        cases = (
+            ("lines", {"margin_mm": 0}),
+            ("dotted-grid", {"dot_radius_mm": 0}),
+            ("day-at-glance", {"schedule_start_hour": 21, "schedule_end_hour": 21}),
+            ("task-list", {"checklist_rows": 0}),
+            ("todo-list", {"checklist_rows": 0}),
+            ("notes", {"notes_fill": "unknown"}),
+        )
+        for template, param_overrides in cases:
+            with self.subTest(template=template, params=param_overrides), _forbid_pdf_output():
+                with self.assertRaises(ValueError):
+                    generate_template(template=template, param_overrides=param_overrides)
+
+    def test_generate_template_supports_todo_list_alias(self) -> None:
+        self._assert_single_page_pdf(_generated_template_pdf("task-list"))
+        self._assert_single_page_pdf(_generated_template_pdf("todo-list"))
+
+    def test_generate_template_supports_local_plugin_module(self) -> None:
+        output_path = self.make_test_dir() / "plugin_blank.pdf"
+        generated_path = generate_template(
+            template="plugin-blank",
+            output_path=output_path,
+            plugin_modules=("demo_template_plugin",),
+        )
+        self.assertEqual(generated_path, output_path)
+        self._assert_single_page_pdf(output_path.read_bytes())
 
     def test_generate_template_emits_plugin_warning_before_unknown_template_error(self) -> None:
         missing_module = "_planner_missing_template_plugin_"
@@ -178,52 +301,29 @@ def register_templates(registry):
 
         def capture_renderer(pdf: object, *, device: object, layout: object, theme: object) -> None:
             captured["layout"] = layout
+            raise _RendererCaptured
 
         templates_module.TEMPLATE_RENDERERS["schedule"] = capture_renderer
+        output_path = self.make_test_dir() / "schedule.pdf"
         try:
-            with tempfile.TemporaryDirectory() as tmp_dir:
-                generate_template(
-                    template="schedule",
-                    output_path=Path(tmp_dir) / "schedule.pdf",
-                    device="palma",
-                )
+            with self.assertRaises(_RendererCaptured):
+                generate_template(template="schedule", output_path=output_path, device="palma")
         finally:
             templates_module.TEMPLATE_RENDERERS["schedule"] = original_renderer
 
+        self.assertFalse(output_path.exists())
         layout = captured["layout"]
         self.assertEqual(layout.schedule_start_hour, 6)
         self.assertEqual(layout.schedule_end_hour, 22)
 
     def test_schedule_template_includes_end_hour_label(self) -> None:
-        labels: list[str] = []
-        original_draw_centred_string = reportlab_canvas.Canvas.drawCentredString
-
-        def capture_draw_centred_string(
-            self: reportlab_canvas.Canvas,
-            x: float,
-            y: float,
-            text: str,
-            *args: object,
-            **kwargs: object,
-        ) -> None:
-            labels.append(text)
-            original_draw_centred_string(self, x, y, text, *args, **kwargs)
-
-        reportlab_canvas.Canvas.drawCentredString = capture_draw_centred_string
-        try:
-            with tempfile.TemporaryDirectory() as tmp_dir:
-                generate_template(
-                    template="schedule",
-                    output_path=Path(tmp_dir) / "schedule.pdf",
-                    param_overrides={
-                        "schedule_start_hour": 6,
-                        "schedule_end_hour": 22,
-                    },
-                )
-        finally:
-            reportlab_canvas.Canvas.drawCentredString = original_draw_centred_string
+        layout = resolve_template_layout(
+            device="remarkable", schedule_start_hour=6, schedule_end_hour=22
+        )
+        pdf = _LabelRecordingPdf()
+        TEMPLATE_RENDERERS["schedule"](pdf, device=DEVICE_PROFILES["remarkable"], layout=layout)
 
-        hour_labels = {label for label in labels if label.isdigit() and len(label) == 2}
+        hour_labels = {label for label in pdf.labels if label.isdigit() and len(label) == 2}
         self.assertIn("22", hour_labels)
 
 
@@ -237,47 +337,305 @@ class TemplateLayoutResolutionTests(unittest.TestCase):
         self.assertEqual(palma_layout.schedule_start_hour, 9)
         self.assertEqual(palma_layout.schedule_end_hour, 19)
 
-    def test_mm_conversion_is_device_aware(self) -> None:
-        self.assertAlmostEqual(
-            mm_to_device_units(25.4, device=DEVICE_PROFILES["remarkable"]),
-            226.0,
-            places=6,
+    def test_layout_without_device_defaults_returns_builtin_profile(self) -> None:
+        self.assertIs(
+            resolve_template_layout(device="remarkable", layout="full"),
+            TEMPLATE_LAYOUT_PROFILES["full"],
         )
-        self.assertAlmostEqual(
-            mm_to_device_units(25.4, device=DEVICE_PROFILES["scribe"]),
-            300.0,
-            places=6,
+
+    def test_layout_validation_reports_first_failing_rule(self) -> None:
+        with self.assertRaisesRegex(ValueError, "header height must be >= 0"):
+            resolve_template_layout(header_height_mm=-1.0)
+        with self.assertRaisesRegex(ValueError, "end hour must be greater than start hour"):
+            resolve_template_layout(schedule_start_hour=10, schedule_end_hour=10)
+
+    def test_repeated_layout_resolution_returns_cached_profile(self) -> None:
+        first = resolve_template_layout(device="scribe", layout="compact", margin_mm=4.0)
+        second = resolve_template_layout(device="scribe", layout="compact", margin_mm=4.0)
+        self.assertIs(first, second)
+        self.assertIsNot(first, resolve_template_layout(device="scribe", layout="compact"))
+
+    def test_unit_conversions_are_device_aware(self) -> None:
+        cases = (
+            (mm_to_device_units, 25.4, "remarkable", 226.0),
+            (mm_to_device_units, 25.4, "scribe", 300.0),
+            (mm_to_device_units, 25.4, "palma", 300.0),
+            (pt_to_device_units, 72.0, "remarkable", 226.0),
+            (pt_to_device_units, 72.0, "scribe", 300.0),
+            (font_pt_to_device_units, 72.0, "remarkable", 226.0),
+            (font_pt_to_device_units, 72.0, "palma", 225.0),
         )
-        self.assertAlmostEqual(
-            mm_to_device_units(25.4, device=DEVICE_PROFILES["palma"]),
-            300.0,
-            places=6,
+        for convert, value, device_name, expected in cases:
+            with self.subTest(convert=convert.__name__, device=device_name):
+                self.assertAlmostEqual(
+                    convert(value, device=DEVICE_PROFILES[device_name]), expected, places=6
+                )
+
+    def test_conversions_reject_non_positive_pixels_per_inch(self) -> None:
+        device = replace(DEVICE_PROFILES["remarkable"], pixels_per_inch=0)
+        with self.assertRaises(ValueError):
+            mm_to_device_units(1.0, device=device)
+        with self.assertRaises(ValueError):
+            font_pt_to_device_units(1.0, device=device)
+
+    def test_device_unit_scales_are_cached_per_device(self) -> None:
+        device = DEVICE_PROFILES["palma"]
+        scales = device_unit_scales(device)
+        self.assertIs(device_unit_scales(device), scales)
+        self.assertEqual(scales.mm * 25.4, mm_to_device_units(25.4, device=device))
+        self.assertEqual(scales.font_pt * 72.0, font_pt_to_device_units(72.0, device=device))
+
+
+class _CountingWidthPdf:
+    """Measure strings as 0.5 units per character per point, counting calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, float]] = []
+
+    def string_width(self, text: str, font_name: str, size: float) -> float:
+        self.calls.append((text, size))
+        return len(text) * size * 0.5
+
+
+class _CurvedWidthPdf(_CountingWidthPdf):
+    """Measure strings with a width that grows faster than the font size."""
+
+    def string_width(self, text: str, font_name: str, size: float) -> float:
+        self.calls.append((text, size))
+        return len(text) * size**1.5
+
+
+class _RecordingPdf(_CountingWidthPdf):
+    """Record the name of every drawing primitive called."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ops: list[str] = []
+
+    def __getattr__(self, name: str) -> object:
+        def record(*args: object, **kwargs: object) -> None:
+            self.ops.append(name)
+
+        return record
+
+
+class _LabelRecordingPdf(_RecordingPdf):
+    """Record the text of every centred label drawn."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.labels: list[str] = []
+
+    def draw_centred_strings(
+        self, items: Iterable[tuple[float, float, str]], **kwargs: Any
+    ) -> None:
+        self.labels.extend(text for _, _, text in items)
+
+
+class _RecordingCanvas:
+    """Record the name of every canvas method called."""
+
+    def __init__(self) -> None:
+        self.ops: list[str] = []
+
+    def __getattr__(self, name: str) -> object:
+        def record(*args: object, **kwargs: object) -> None:
+            self.ops.append(name)
+
+        return record
+
+
+class TemplateLabelFittingTests(unittest.TestCase):
+    def test_pick_fitting_label_measures_each_size_once(self) -> None:
+        pdf = _CountingWidthPdf()
+        label, size = _pick_fitting_label(
+            pdf,
+            candidates=("SCHEDULE", "SCHED"),
+            font_name="Helvetica",
+            preferred_size=10.0,
+            min_size=8.0,
+            max_width=21.0,
         )
 
-    def test_point_conversion_is_device_aware(self) -> None:
-        self.assertAlmostEqual(
-            pt_to_device_units(72.0, device=DEVICE_PROFILES["remarkable"]),
-            226.0,
-            places=6,
+        self.assertEqual((label, size), ("SCHED", 8.0))
+        self.assertEqual(len(pdf.calls), len(set(pdf.calls)))
+
+    def test_fit_font_size_predicts_fitting_step_from_one_probe(self) -> None:
+        pdf = _CountingWidthPdf()
+        size = _fit_font_size_to_width(
+            pdf,
+            text="ABCD",
+            font_name="Helvetica",
+            preferred_size=24.0,
+            min_size=4.0,
+            max_width=25.0,
         )
-        self.assertAlmostEqual(
-            pt_to_device_units(72.0, device=DEVICE_PROFILES["scribe"]),
-            300.0,
-            places=6,
+
+        self.assertEqual(size, 12.5)
+        self.assertEqual(pdf.calls, [("ABCD", 24.0), ("ABCD", 12.5), ("ABCD", 13.0)])
+
+    def test_fit_font_size_matches_half_point_steps_for_non_proportional_widths(self) -> None:
+        size = _fit_font_size_to_width(
+            _CurvedWidthPdf(),
+            text="ABCD",
+            font_name="Helvetica",
+            preferred_size=24.0,
+            min_size=4.0,
+            max_width=100.0,
         )
 
-    def test_font_point_conversion_applies_device_scale(self) -> None:
-        self.assertAlmostEqual(
-            font_pt_to_device_units(72.0, device=DEVICE_PROFILES["remarkable"]),
-            226.0,
-            places=6,
+        self.assertEqual(size, 8.5)
+
+    def test_title_candidates_shorten_in_order_without_duplicates(self) -> None:
+        self.assertEqual(
+            list(_title_candidates("DAY AT A GLANCE")),
+            ["DAY AT A GLANCE", "DAY GLANCE", "DAYATAGLANCE"],
         )
-        self.assertAlmostEqual(
-            font_pt_to_device_units(72.0, device=DEVICE_PROFILES["palma"]),
-            225.0,
-            places=6,
+        self.assertEqual(list(_title_candidates("NOTES")), ["NOTES"])
+
+    def test_pick_fitting_label_stops_consuming_candidates_once_one_fits(self) -> None:
+        candidates = iter(("SCHED", "SCHEDULE"))
+        label, size = _pick_fitting_label(
+            _CountingWidthPdf(),
+            candidates=candidates,
+            font_name="Helvetica",
+            preferred_size=8.0,
+            min_size=6.0,
+            max_width=21.0,
         )
 
+        self.assertEqual((label, size), ("SCHED", 8.0))
+        self.assertEqual(list(candidates), ["SCHEDULE"])
+
+    def test_pick_fitting_label_falls_back_to_last_candidate(self) -> None:
+        label, size = _pick_fitting_label(
+            _CountingWidthPdf(),
+            candidates=("SCHEDULE", "SCHED"),
+            font_name="Helvetica",
+            preferred_size=10.0,
+            min_size=8.0,
+            max_width=5.0,
+        )
+        self.assertEqual((label, size), ("SCHED", 8.0))
+
+    def test_header_labels_are_fitted_with_each_backends_own_metrics(self) -> None:
+        scales = device_unit_scales(DEVICE_PROFILES["palma"])
+        labels = []
+        for pdf in (_CountingWidthPdf(), _CurvedWidthPdf()):
+            labels.append(
+                _fit_header_labels(
+                    pdf,
+                    title="CACHED HEADER",
+                    font_name="Helvetica-Bold",
+                    scales=scales,
+                    content_width=400.0,
+                )
+            )
+            self.assertTrue(pdf.calls)
+            self.assertEqual(len(pdf.calls), len(set(pdf.calls)))
+
+        self.assertEqual((labels[0].title, labels[0].date), ("CACHED HEADER", "DATE"))
+        self.assertEqual((labels[1].title, labels[1].date), ("CACHEDHEADER", "DT"))
+
+
+class TemplateRendererStateTests(unittest.TestCase):
+    def test_row_templates_set_drawing_state_independently_of_row_count(self) -> None:
+        device = DEVICE_PROFILES["remarkable"]
+        state_ops = ("set_line_width", "set_stroke_color", "set_fill_color", "set_font")
+        for template in ("schedule", "day-at-glance", "task-list"):
+            with self.subTest(template=template):
+                state_calls = []
+                for rows in (4, 16):
+                    layout = resolve_template_layout(
+                        device="remarkable",
+                        schedule_start_hour=6,
+                        schedule_end_hour=6 + rows,
+                        checklist_rows=rows,
+                    )
+                    pdf = _RecordingPdf()
+                    TEMPLATE_RENDERERS[template](pdf, device=device, layout=layout)
+                    state_calls.append([pdf.ops.count(op) for op in state_ops])
+                self.assertEqual(state_calls[0], state_calls[1])
+
+    def test_notes_template_rejects_unknown_fill_before_drawing(self) -> None:
+        pdf = _RecordingPdf()
+        with self.assertRaisesRegex(ValueError, "unknown notes fill 'waves'"):
+            TEMPLATE_RENDERERS["notes"](
+                pdf,
+                device=DEVICE_PROFILES["remarkable"],
+                layout=resolve_template_layout(device="remarkable"),
+                notes_fill="waves",
+            )
+        self.assertEqual(pdf.ops, [])
+
+    def test_reportlab_primitives_skip_unchanged_stroke_state(self) -> None:
+        target = _RecordingCanvas()
+        pdf = ReportLabPrimitives(target)  # type: ignore[arg-type]
+        pdf.set_stroke_color(Theme.GRID_LINES)
+        pdf.set_line_width(0.5)
+        pdf.set_stroke_color(Theme.GRID_LINES)
+        pdf.set_line_width(0.5)
+        pdf.save_state()
+        pdf.set_line_width(2.0)
+        pdf.restore_state()
+        pdf.set_line_width(0.5)
+        pdf.set_line_width(2.0)
+        pdf.show_page()
+        pdf.set_line_width(2.0)
+
+        self.assertEqual(
+            target.ops,
+            [
+                "setStrokeColor",
+                "setLineWidth",
+                "saveState",
+                "setLineWidth",
+                "restoreState",
+                "setLineWidth",
+                "showPage",
+                "setLineWidth",
+            ],
+        )
+
+    def test_reportlab_primitives_skip_unchanged_font(self) -> None:
+        target = _RecordingCanvas()
+        pdf = ReportLabPrimitives(target)  # type: ignore[arg-type]
+        pdf.set_font("Helvetica-Bold", 10.0)
+        pdf.set_font("Helvetica-Bold", 10.0)
+        pdf.save_state()
+        pdf.set_font("Helvetica", 10.0)
+        pdf.restore_state()
+        pdf.set_font("Helvetica-Bold", 10.0)
+        pdf.show_page()
+        pdf.set_font("Helvetica-Bold", 10.0)
+
+        self.assertEqual(
+            target.ops,
+            ["setFont", "saveState", "setFont", "restoreState", "showPage", "setFont"],
+        )
+
+    def test_reportlab_primitives_fill_overlapping_dots_with_non_zero_winding(self) -> None:
+        from reportlab.pdfgen import canvas
+
+        target = canvas.Canvas(io.BytesIO(), pageCompression=0)
+        pdf = ReportLabPrimitives(target)
+        pdf.circles(((10.0, 10.0), (12.0, 10.0)), 3.0, fill=1, stroke=0)
+        pdf.show_page()
+
+        content = target.getpdfdata()
+        path_ops = re.findall(rb"^(f\*?)$", content, flags=re.MULTILINE)
+        self.assertEqual(path_ops, [b"f"])
+
+    def test_page_background_is_skipped_for_white_theme(self) -> None:
+        device = DEVICE_PROFILES["remarkable"]
+        white_theme = ThemeProfile(background="#FFFFFF").to_theme_class()
+        pdf = _RecordingPdf()
+        draw_page_background(pdf, device, theme=white_theme)
+        self.assertEqual(pdf.ops, [])
+
+        draw_page_background(pdf, device, theme=ThemeProfile().to_theme_class())
+        self.assertEqual(pdf.ops, ["set_fill_color", "rect"])
+
 
 class TemplateRegistryApiTests(unittest.TestCase):
     def test_list_template_specs_matches_template_types(self) -> None:
@@ -289,3 +647,19 @@ class TemplateRegistryApiTests(unittest.TestCase):
         spec = get_template_spec("notes")
         self.assertEqual(spec.template_id, "notes")
         self.assertEqual(spec.title, "Notes")
+
+    def test_build_template_registry_returns_independent_registries(self) -> None:
+        registry, warnings = build_template_registry()
+        self.assertEqual(warnings, ())
+        self.assertIsNot(build_template_registry()[0], registry)
+
+        registry.register(replace(get_template_spec("lines"), template_id="mine", aliases=()))
+        self.assertNotIn("mine", available_template_types())
+        self.assertEqual(build_template_registry()[0].template_ids(), TEMPLATE_TYPES)
+
+    def test_build_template_registry_retries_plugins_that_failed(self) -> None:
+        missing_module = "_planner_missing_registry_plugin_"
+        first, first_warnings = build_template_registry(plugin_modules=(missing_module,))
+        second, second_warnings = build_template_registry(plugin_modules=(missing_module,))
+        self.assertEqual(len(first_warnings), 1)
+        self.assertEqual(second_warnings, first_warnings)
@@ -3,16 +3,28 @@
 from __future__ import annotations
 
 import json
-import tempfile
-import unittest
-from pathlib import Path
 
 from reportlab.lib import colors
 
 from planner.theme_profiles import available_theme_profiles, resolve_theme
+from support import TempRootTestCase
 
+# Read-only theme files shared by the tests, written once per class.
+THEME_FILES = {
+    "overrides.json": {"accent": "#112233", "font_header": "Courier-Bold"},
+    "unknown_key.json": {"unknown": "#111111"},
+    "invalid_color.json": {"accent": "invalid-color"},
+    "non_string_color.json": {"accent": [1, 2, 3]},
+}
+
+
+class ThemeProfileTests(TempRootTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        for file_name, payload in THEME_FILES.items():
+            (cls.tmp_root / file_name).write_text(json.dumps(payload), encoding="utf-8")
 
-class ThemeProfileTests(unittest.TestCase):
     def test_available_theme_profiles_contains_default(self) -> None:
         self.assertIn("default", available_theme_profiles())
 
@@ -22,34 +34,36 @@ class ThemeProfileTests(unittest.TestCase):
         self.assertEqual(theme.ACCENT.rgb(), colors.HexColor("#E67E22").rgb())
 
     def test_resolve_theme_applies_json_overrides(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            theme_path = Path(tmp_dir) / "theme.json"
-            theme_path.write_text(
-                json.dumps(
-                    {
-                        "accent": "#112233",
-                        "font_header": "Courier-Bold",
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            theme = resolve_theme(theme_file=theme_path)
-            self.assertEqual(theme.ACCENT.rgb(), colors.HexColor("#112233").rgb())
-            self.assertEqual(theme.FONT_HEADER, "Courier-Bold")
+        theme = resolve_theme(theme_file=self.tmp_root / "overrides.json")
+        self.assertEqual(theme.ACCENT.rgb(), colors.HexColor("#112233").rgb())
+        self.assertEqual(theme.FONT_HEADER, "Courier-Bold")
 
     def test_resolve_theme_rejects_unknown_key(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            theme_path = Path(tmp_dir) / "theme.json"
-            theme_path.write_text(json.dumps({"unknown": "#111111"}), encoding="utf-8")
-
-            with self.assertRaisesRegex(ValueError, "unknown theme key\\(s\\): unknown"):
-                resolve_theme(theme_file=theme_path)
+        with self.assertRaisesRegex(ValueError, "unknown theme key\\(s\\): unknown"):
+            resolve_theme(theme_file=self.tmp_root / "unknown_key.json")
 
     def test_resolve_theme_rejects_invalid_color(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            theme_path = Path(tmp_dir) / "theme.json"
-            theme_path.write_text(json.dumps({"accent": "invalid-color"}), encoding="utf-8")
+        with self.assertRaisesRegex(ValueError, "invalid color value 'invalid-color'"):
+            resolve_theme(theme_file=self.tmp_root / "invalid_color.json")
+
+    def test_resolve_theme_shares_parsed_values_but_not_class_attributes(self) -> None:
+        first = resolve_theme()
+        self.assertIs(resolve_theme().ACCENT, first.ACCENT)
+
+        first.ACCENT = colors.red
+        self.assertEqual(resolve_theme().ACCENT.rgb(), colors.HexColor("#E67E22").rgb())
+
+    def test_resolve_theme_rejects_non_string_color(self) -> None:
+        with self.assertRaisesRegex(ValueError, "theme key 'accent' must be a non-empty"):
+            resolve_theme(theme_file=self.tmp_root / "non_string_color.json")
+
+    def test_resolve_theme_rereads_theme_file_after_it_changes(self) -> None:
+        theme_path = self.make_test_dir() / "theme.json"
+        theme_path.write_text(json.dumps({"accent": "#112233"}), encoding="utf-8")
+        first = resolve_theme(theme_file=theme_path)
+        self.assertIs(resolve_theme(theme_file=theme_path).ACCENT, first.ACCENT)
 
-            with self.assertRaisesRegex(ValueError, "invalid color value 'invalid-color'"):
-                resolve_theme(theme_file=theme_path)
+        theme_path.write_text(json.dumps({"accent": "#445566", "font_bold": "Courier"}))
+        updated = resolve_theme(theme_file=theme_path)
+        self.assertEqual(updated.ACCENT.rgb(), colors.HexColor("#445566").rgb())
+        self.assertEqual(updated.FONT_BOLD, "Courier")